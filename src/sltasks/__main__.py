@@ -1,14 +1,136 @@
 """CLI entry point for sltasks."""
 
-import argparse
-from pathlib import Path
+from __future__ import annotations
 
-from .config import Settings
-from .logging import setup_logging
+import sys
+
+from . import __version__
+
+# Type checkers treat this as typing.TYPE_CHECKING; defining it here keeps
+# `typing` out of the --version and --help paths
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+
+
+def _print_version(argv: list[str]) -> bool:
+    """Print the version and return True if argv is a bare --version request.
+
+    Handled before argparse is constructed so `sltasks --version` never pays
+    for building the parser or importing settings, logging, or the TUI stack.
+    """
+    if argv != ["--version"]:
+        return False
+    print(f"sltasks {__version__}")
+    return True
+
+
+# Top-level options that take a value, which may look like a subcommand name
+_VALUE_OPTIONS = frozenset({"--task-root", "--log-file", "--github-setup"})
+
+# Subcommand name -> summary shown in the top-level help, in listing order
+_SUBCOMMAND_HELP = {
+    "push": "Push local tasks to GitHub as new issues",
+    "sync": "Sync issues from GitHub to local files",
+}
+
+
+def _add_push_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the push command: sltasks push [files...]"""
+    push_parser = subparsers.add_parser("push", help=_SUBCOMMAND_HELP["push"])
+    push_parser.add_argument(
+        "files",
+        nargs="*",
+        help="Specific files to push (default: all local-only tasks)",
+    )
+    push_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be pushed without creating issues",
+    )
+    push_parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompt",
+    )
+    push_parser.add_argument(
+        "--delete",
+        action="store_true",
+        help="Delete local files after pushing",
+    )
+    push_parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Archive local files after pushing (set archived: true)",
+    )
+
+
+def _add_sync_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the sync command: sltasks sync"""
+    sync_parser = subparsers.add_parser("sync", help=_SUBCOMMAND_HELP["sync"])
+    sync_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be synced without writing files",
+    )
+    sync_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite local changes (resolve conflicts to GitHub)",
+    )
+
+
+# Subcommand name -> function adding its parser, in help listing order
+_SUBCOMMAND_PARSERS = {
+    "push": _add_push_parser,
+    "sync": _add_sync_parser,
+}
+
+# Subcommand name -> (runner module, runner function, parsed arguments passed by name)
+_SUBCOMMAND_RUNNERS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "push": (".cli.push", "run_push", ("files", "dry_run", "yes", "delete", "archive")),
+    "sync": (".cli.sync", "run_sync", ("dry_run", "force")),
+}
+
+
+def _command_word(argv: list[str]) -> str | None:
+    """Find the first positional argument in argv, the subcommand if any."""
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in _VALUE_OPTIONS:
+            skip_value = True
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _is_top_level_help(argv: list[str]) -> bool:
+    """Whether argv asks for the top-level help rather than a subcommand's."""
+    return ("-h" in argv or "--help" in argv) and _command_word(argv) is None
+
+
+def _subcommands_to_build(argv: list[str]) -> list[str]:
+    """Pick the subcommand parsers argparse needs for argv.
+
+    A plain TUI launch needs none and a subcommand needs only its own. An
+    unknown word needs them all for argparse's "invalid choice" error, as
+    does help alongside one; parse_args() lists the subcommands for the
+    top-level help without building their arguments.
+    """
+    command = _command_word(argv)
+    if "-h" in argv or "--help" in argv or (command and command not in _SUBCOMMAND_PARSERS):
+        return list(_SUBCOMMAND_PARSERS)
+    return [command] if command else []
 
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
+    import argparse
+    from pathlib import Path
+
     parser = argparse.ArgumentParser(
         prog="sltasks",
         description="Terminal-based Kanban TUI for markdown task management",
@@ -40,7 +162,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--version",
         action="version",
-        version="%(prog)s 0.1.0",
+        version=f"%(prog)s {__version__}",
     )
     parser.add_argument(
         "--github-setup",
@@ -51,77 +173,47 @@ def parse_args() -> argparse.Namespace:
         help="Interactive setup for GitHub Projects integration. Optionally pass project URL.",
     )
 
-    # Subcommands
+    # Subcommands; only the parsers this invocation can reach are built
+    argv = sys.argv[1:]
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    if _is_top_level_help(argv):
+        # The listing shows only names and summaries, so skip each command's arguments
+        for name, summary in _SUBCOMMAND_HELP.items():
+            subparsers.add_parser(name, help=summary)
+    else:
+        for name in _subcommands_to_build(argv):
+            _SUBCOMMAND_PARSERS[name](subparsers)
 
-    # Push command: sltasks push [files...]
-    push_parser = subparsers.add_parser(
-        "push",
-        help="Push local tasks to GitHub as new issues",
-    )
-    push_parser.add_argument(
-        "files",
-        nargs="*",
-        help="Specific files to push (default: all local-only tasks)",
-    )
-    push_parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Show what would be pushed without creating issues",
-    )
-    push_parser.add_argument(
-        "-y",
-        "--yes",
-        action="store_true",
-        help="Skip confirmation prompt",
-    )
-    push_parser.add_argument(
-        "--delete",
-        action="store_true",
-        help="Delete local files after pushing",
-    )
-    push_parser.add_argument(
-        "--archive",
-        action="store_true",
-        help="Archive local files after pushing (set archived: true)",
-    )
-
-    # Sync command: sltasks sync
-    sync_parser = subparsers.add_parser(
-        "sync",
-        help="Sync issues from GitHub to local files",
-    )
-    sync_parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Show what would be synced without writing files",
-    )
-    sync_parser.add_argument(
-        "--force",
-        action="store_true",
-        help="Overwrite local changes (resolve conflicts to GitHub)",
-    )
-
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     """Main entry point."""
+    if _print_version(sys.argv[1:]):
+        raise SystemExit(0)
+
     args = parse_args()
 
-    # Build settings from CLI args
-    settings_kwargs: dict = {}
-    if args.task_root:
-        settings_kwargs["project_root"] = args.task_root
-    if args.verbose:
-        settings_kwargs["verbose"] = args.verbose
-    if args.log_file:
-        settings_kwargs["log_file"] = args.log_file
+    # Deferred until after argparse so --help exits without loading pydantic
+    from .config import Settings
 
+    # Build settings from the CLI args that were given
+    settings_kwargs = {
+        name: value
+        for name, value in (
+            ("project_root", args.task_root),
+            ("verbose", args.verbose),
+            ("log_file", args.log_file),
+        )
+        if value
+    }
     settings = Settings(**settings_kwargs)
 
-    # Setup logging based on verbosity
-    setup_logging(settings.verbose, settings.log_file)
+    # Setup logging based on verbosity; it stays off (and unimported) without -v or --log-file
+    if settings.verbose or settings.log_file:
+        from .logging import setup_logging
+
+        setup_logging(settings.verbose, settings.log_file)
 
     # Handle --generate command
     if args.generate:
@@ -139,29 +231,15 @@ def main() -> None:
         exit_code = run_github_setup(settings.project_root, project_url)
         raise SystemExit(exit_code)
 
-    # Handle subcommands
-    if args.command == "push":
-        from .cli.push import run_push
-
-        exit_code = run_push(
-            project_root=settings.project_root,
-            files=args.files if args.files else None,
-            dry_run=args.dry_run,
-            yes=args.yes,
-            delete=args.delete,
-            archive=args.archive,
-        )
-        raise SystemExit(exit_code)
-
-    if args.command == "sync":
-        from .cli.sync import run_sync
+    # Handle subcommands; the runner's module is imported only when dispatched
+    runner = _SUBCOMMAND_RUNNERS.get(args.command)
+    if runner is not None:
+        import importlib
 
-        exit_code = run_sync(
-            project_root=settings.project_root,
-            dry_run=args.dry_run,
-            force=args.force,
-        )
-        raise SystemExit(exit_code)
+        module_name, function_name, arg_names = runner
+        run_command = getattr(importlib.import_module(module_name, __package__), function_name)
+        kwargs = {name: getattr(args, name) for name in arg_names}
+        raise SystemExit(run_command(project_root=settings.project_root, **kwargs))
 
     # Default: launch TUI
     from .app import run
@@ -0,0 +1,39 @@
+"""Lazy public names for package __init__ modules (PEP 562)."""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_module(
+    module_name: str, imports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's module-level __getattr__ and __dir__.
+
+    Each public name is imported from its submodule on first access, so
+    importing the package doesn't load everything it re-exports.
+
+    Args:
+        module_name: The package's __name__
+        imports: Public name -> relative submodule that defines it (e.g. ".task")
+
+    Returns:
+        (__getattr__, __dir__) to assign at the package's top level.
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import a public name from its submodule on first access."""
+        submodule = imports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, module_name), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        """List the package's loaded names and its lazy public names."""
+        return sorted({*vars(sys.modules[module_name]), *imports})
+
+    return __getattr__, __dir__
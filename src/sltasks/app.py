@@ -1,15 +1,24 @@
 """sltasks TUI Application."""
 
+import functools
+import importlib
 import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Concatenate
 
 from textual.app import App
 from textual.binding import Binding
 from textual.screen import ModalScreen
 
+# The github package resolves its client lazily; the except clauses below look
+# up github.GitHubClientError only when an error is raised, so filesystem
+# boards never import the HTTP stack
+from . import github
 from .config import Settings
-from .github import GitHubClient, GitHubClientError
+from .models import Task
 from .models.sync import SyncStatus
-from .repositories import FilesystemRepository, GitHubProjectsRepository, RepositoryProtocol
 from .services import (
     BoardService,
     ConfigService,
@@ -17,58 +26,93 @@ from .services import (
     TaskService,
     TemplateService,
 )
-from .sync.engine import GitHubSyncEngine
 from .ui.screens.board import BoardScreen
-from .ui.widgets import (
-    CommandBar,
-    ConfirmModal,
-    HelpScreen,
-    TaskPreviewModal,
-    TypeSelectorModal,
-)
+
+if TYPE_CHECKING:
+    from .repositories import RepositoryProtocol
+    from .repositories.github_projects import GitHubProjectsRepository
+    from .sync.engine import GitHubSyncEngine
 
 logger = logging.getLogger(__name__)
 
+# Screens and modals imported on first use by their actions
+_PREWARM_MODULES = (
+    ".ui.widgets.task_preview_modal",
+    ".ui.widgets.type_selector",
+    ".ui.widgets.confirm_modal",
+    ".ui.screens.help",
+)
+
+
+def _prewarm_imports(module_names: tuple[str, ...]) -> None:
+    """Import modules ahead of use, so the first key that needs one doesn't wait."""
+    for module_name in module_names:
+        importlib.import_module(module_name, __package__)
+
+
+@functools.cache
+def _state_label(state: str) -> str:
+    """State as shown in notifications ("in_progress" -> "in progress").
+
+    Cached per state; a board only has a handful.
+    """
+    return state.replace("_", " ")
+
+
+def _with_current_task[**P](
+    action: Callable[Concatenate["SltasksApp", BoardScreen, Task, P], None],
+) -> Callable[Concatenate["SltasksApp", P], None]:
+    """Run an action on the board's focused task, passing the screen and task.
+
+    The action is skipped unless the board is the active screen and its
+    current column has a task.
+    """
+
+    @functools.wraps(action)
+    def wrapper(self: "SltasksApp", *args: P.args, **kwargs: P.kwargs) -> None:
+        screen = self.screen
+        if not isinstance(screen, BoardScreen):
+            return
+        task = screen.get_current_task()
+        if task is None:
+            return
+        action(self, screen, task, *args, **kwargs)
+
+    return wrapper
+
 
 class SltasksApp(App):
     """sltasks - Terminal Kanban TUI."""
 
     TITLE = "sltasks"
 
-    CSS_PATH = "ui/styles.tcss"
+    # Absolute so Textual doesn't resolve it against the class file on every
+    # construction; the stylesheet itself is only read once the app starts running
+    CSS_PATH = Path(__file__).parent / "ui" / "styles.tcss"
 
+    # Keys sharing an action are comma-joined so each Binding is built once;
+    # Textual expands them into one binding per key when the class is created.
     BINDINGS = [
         # Core bindings
         Binding("q", "quit", "Quit", show=True),
         Binding("?", "help", "Help", show=True),
         Binding("r", "refresh", "Refresh", show=True),
-        # Navigation - vim style
-        Binding("h", "nav_left", "← Column", show=False),
-        Binding("j", "nav_down", "↓ Task", show=False),
-        Binding("k", "nav_up", "↑ Task", show=False),
-        Binding("l", "nav_right", "→ Column", show=False),
-        # Navigation - arrow keys
-        Binding("left", "nav_left", "← Column", show=False),
-        Binding("down", "nav_down", "↓ Task", show=False),
-        Binding("up", "nav_up", "↑ Task", show=False),
-        Binding("right", "nav_right", "→ Column", show=False),
+        # Navigation - vim style and arrow keys
+        Binding("h,left", "nav_column(-1)", "← Column", show=False),
+        Binding("j,down", "nav_task(1)", "↓ Task", show=False),
+        Binding("k,up", "nav_task(-1)", "↑ Task", show=False),
+        Binding("l,right", "nav_column(1)", "→ Column", show=False),
         # Jump navigation
-        Binding("g", "nav_first", "First", show=False),
-        Binding("G", "nav_last", "Last", show=False),
-        Binding("home", "nav_first", "First", show=False),
-        Binding("end", "nav_last", "Last", show=False),
+        Binding("g,home", "nav_to_task(0)", "First", show=False),
+        Binding("G,end", "nav_to_task(-1)", "Last", show=False),
         # Task actions
         Binding("n", "new_task", "New", show=True),
         Binding("e", "edit_task", "Edit", show=True),
         Binding("enter", "preview_task", "Preview", show=False),
-        Binding("H", "move_task_left", "Move ←", show=False),
-        Binding("L", "move_task_right", "Move →", show=False),
-        Binding("shift+left", "move_task_left", "Move ←", show=False),
-        Binding("shift+right", "move_task_right", "Move →", show=False),
-        Binding("K", "move_task_up", "Move ↑", show=False),
-        Binding("J", "move_task_down", "Move ↓", show=False),
-        Binding("shift+up", "move_task_up", "Move ↑", show=False),
-        Binding("shift+down", "move_task_down", "Move ↓", show=False),
+        Binding("H,shift+left", "move_task_left", "Move ←", show=False),
+        Binding("L,shift+right", "move_task_right", "Move →", show=False),
+        Binding("K,shift+up", "move_task_up", "Move ↑", show=False),
+        Binding("J,shift+down", "move_task_down", "Move ↓", show=False),
         Binding("a", "archive_task", "Archive", show=True),
         Binding("d", "delete_task", "Delete", show=False),
         Binding("space", "toggle_state", "Toggle", show=False),
@@ -86,6 +130,11 @@ class SltasksApp(App):
     def __init__(self, settings: Settings | None = None) -> None:
         super().__init__()
         self.settings = settings or Settings()
+        # Board refresh requested for the next tick, and whether it re-detects sync statuses
+        self._refresh_pending = False
+        self._refresh_sync_pending = False
+        # Startup sync detection is running on a worker; main-thread detection waits for it
+        self._initial_sync_pending = False
         self._init_services()
 
     def _init_services(self) -> None:
@@ -109,16 +158,22 @@ class SltasksApp(App):
 
         # Initialize repository based on provider
         self.repository: RepositoryProtocol
+        github_repository: GitHubProjectsRepository | None = None
         if config.provider == "github":
             logger.info("Using GitHub Projects repository")
             if config.github:
                 logger.debug("GitHub project URL: %s", config.github.project_url)
                 logger.debug("GitHub default repo: %s", config.github.default_repo)
-            self.repository = GitHubProjectsRepository(self.config_service)
+            from .repositories import github_projects
+
+            github_repository = github_projects.GitHubProjectsRepository(self.config_service)
+            self.repository = github_repository
         else:
             # Default to filesystem
             task_root = self.config_service.task_root
             logger.info("Using filesystem repository: %s", task_root)
+            from .repositories.filesystem import FilesystemRepository
+
             self.repository = FilesystemRepository(task_root, self.config_service)
 
         # Validate repository configuration
@@ -141,19 +196,20 @@ class SltasksApp(App):
         self.sync_engine: GitHubSyncEngine | None = None
         self._sync_statuses: dict[str, SyncStatus] = {}
         if (
-            config.provider == "github"
+            github_repository is not None
             and config.github
             and config.github.sync
             and config.github.sync.enabled
         ):
             logger.info("GitHub sync enabled, initializing sync engine")
+            from .sync import engine
+
             try:
-                client = GitHubClient.from_environment(
-                    base_url=config.github.base_url or "api.github.com"
-                )
-                self.sync_engine = GitHubSyncEngine(
+                # Sync is GitHub-only, so share the repository's client: one token
+                # lookup and one pool of connections for both
+                self.sync_engine = engine.GitHubSyncEngine(
                     self.config_service,
-                    client,
+                    github_repository.client,
                     self.config_service.task_root,
                 )
             except Exception as e:
@@ -169,7 +225,7 @@ class SltasksApp(App):
         banner = self.config_service.get_banner()
 
         # For GitHub provider, use project title if no explicit banner configured
-        if banner == "sltasks" and hasattr(self.repository, "get_board_metadata"):
+        if banner == "sltasks":
             try:
                 metadata = self.repository.get_board_metadata()
                 if metadata.get("project_title"):
@@ -190,44 +246,42 @@ class SltasksApp(App):
 
     def refresh_sync_statuses(self) -> None:
         """Refresh sync statuses from the sync engine."""
+        self._sync_statuses = self._detect_sync_statuses()
+        # Newer than anything the startup worker has yet to report
+        self._initial_sync_pending = False
+
+    def _detect_sync_statuses(self) -> dict[str, SyncStatus]:
+        """Build the task_id -> SyncStatus map from the sync engine's changes.
+
+        Doesn't touch app state, so the startup worker can run it off the main thread.
+        """
         if not self.sync_engine:
-            self._sync_statuses = {}
-            return
+            return {}
 
         try:
             changes = self.sync_engine.detect_changes()
 
-            # Build status map
-            statuses: dict[str, SyncStatus] = {}
-
-            # Mark tasks that need to be pulled
-            for task_id in changes.to_pull:
-                statuses[task_id] = SyncStatus.REMOTE_MODIFIED
-
-            # Mark tasks that need to be pushed
-            for task_id in changes.to_push:
-                # Check if it's a local-only file or a modified synced file
-                if "#" not in task_id:  # Local-only files don't have repo#number format
-                    statuses[task_id] = SyncStatus.LOCAL_ONLY
-                else:
-                    statuses[task_id] = SyncStatus.LOCAL_MODIFIED
-
-            # Mark conflicts
-            for conflict in changes.conflicts:
-                statuses[conflict.task_id] = SyncStatus.CONFLICT
-
-            # Mark remaining synced files as synced (those not in any change category)
-            synced_files = self.sync_engine._scan_synced_files()
-            for task in synced_files:
-                if task.id not in statuses:
-                    statuses[task.id] = SyncStatus.SYNCED
+            # Build status map; later categories override earlier ones, so synced
+            # files not in any change category stay SYNCED and conflicts win
+            statuses = dict.fromkeys(changes.synced, SyncStatus.SYNCED)
+            statuses.update(dict.fromkeys(changes.to_pull, SyncStatus.REMOTE_MODIFIED))
+            # Local-only files don't have the repo#number format
+            statuses.update(
+                {
+                    task_id: SyncStatus.LOCAL_MODIFIED if "#" in task_id else SyncStatus.LOCAL_ONLY
+                    for task_id in changes.to_push
+                }
+            )
+            statuses.update(
+                dict.fromkeys((c.task_id for c in changes.conflicts), SyncStatus.CONFLICT)
+            )
 
-            self._sync_statuses = statuses
             logger.debug("Refreshed sync statuses: %d tasks", len(statuses))
+            return statuses
 
         except Exception as e:
             logger.warning("Failed to refresh sync statuses: %s", e)
-            self._sync_statuses = {}
+            return {}
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
@@ -236,20 +290,70 @@ class SltasksApp(App):
             self.notify(f"Error: {self._init_error}", severity="error", timeout=10)
 
         # Ensure tasks directory exists (filesystem only)
-        if hasattr(self.repository, "ensure_directory"):
-            self.repository.ensure_directory()
-
-        # Refresh sync statuses if sync is enabled
-        if self.sync_engine:
-            self.refresh_sync_statuses()
+        self.repository.ensure_directory()
 
-        # Push the board screen
+        # Push the board screen; sync statuses (which may need the network)
+        # are detected on a worker and filled in once they arrive
         self.push_screen("board")
+        if self.sync_engine:
+            self._initial_sync_pending = True
+            self.run_worker(
+                self._detect_initial_sync_statuses,
+                name="sync-statuses",
+                group="sync-statuses",
+                exclusive=True,
+                thread=True,
+            )
+        self.call_after_refresh(self._start_prewarm)
+
+    def _detect_initial_sync_statuses(self) -> None:
+        """Detect sync statuses off the main thread and hand them to the main thread."""
+        statuses = self._detect_sync_statuses()
+        self.call_from_thread(self._set_initial_sync_statuses, statuses)
+
+    def _set_initial_sync_statuses(self, statuses: dict[str, SyncStatus]) -> None:
+        """Store the startup worker's sync statuses and refresh the board."""
+        if not self._initial_sync_pending:
+            return  # Superseded by a detection on the main thread
+        self._sync_statuses = statuses
+        self._initial_sync_pending = False
+        self._schedule_refresh()
+
+    def _start_prewarm(self) -> None:
+        """Import the lazily loaded screens on a background thread after first paint."""
+        module_names = _PREWARM_MODULES
+        if self.sync_engine:
+            module_names += (".ui.screens.sync_screen",)
+        threading.Thread(
+            target=_prewarm_imports, args=(module_names,), name="sltasks-prewarm", daemon=True
+        ).start()
 
     def action_refresh(self) -> None:
         """Refresh the board."""
         # Refresh sync statuses if enabled
-        if self.sync_engine:
+        self._schedule_refresh(sync_statuses=self.sync_engine is not None)
+
+    def _schedule_refresh(self, sync_statuses: bool = False) -> None:
+        """Refresh the board on the next tick, once however often it is requested.
+
+        Args:
+            sync_statuses: Also re-detect sync statuses before the refresh.
+        """
+        self._refresh_sync_pending |= sync_statuses
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.call_later(self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        """Run the refresh requested through _schedule_refresh.
+
+        While the startup worker is still detecting sync statuses, detection
+        stays pending and runs with the refresh that follows its result.
+        """
+        self._refresh_pending = False
+        if self._refresh_sync_pending and not self._initial_sync_pending:
+            self._refresh_sync_pending = False
             self.refresh_sync_statuses()
 
         screen = self.screen
@@ -258,44 +362,28 @@ class SltasksApp(App):
 
     def action_help(self) -> None:
         """Show help screen."""
+        from .ui.screens.help import HelpScreen
+
         self.push_screen(HelpScreen())
 
     # Navigation actions
-    def action_nav_left(self) -> None:
-        """Navigate to previous column."""
-        screen = self.screen
-        if isinstance(screen, BoardScreen):
-            screen.navigate_column(-1)
-
-    def action_nav_right(self) -> None:
-        """Navigate to next column."""
-        screen = self.screen
-        if isinstance(screen, BoardScreen):
-            screen.navigate_column(1)
-
-    def action_nav_up(self) -> None:
-        """Navigate to previous task."""
-        screen = self.screen
-        if isinstance(screen, BoardScreen):
-            screen.navigate_task(-1)
-
-    def action_nav_down(self) -> None:
-        """Navigate to next task."""
+    def action_nav_column(self, delta: int) -> None:
+        """Navigate to the previous (-1) or next (+1) column."""
         screen = self.screen
         if isinstance(screen, BoardScreen):
-            screen.navigate_task(1)
+            screen.navigate_column(delta)
 
-    def action_nav_first(self) -> None:
-        """Navigate to first task in column."""
+    def action_nav_task(self, delta: int) -> None:
+        """Navigate to the previous (-1) or next (+1) task."""
         screen = self.screen
         if isinstance(screen, BoardScreen):
-            screen.navigate_to_task(0)
+            screen.navigate_task(delta)
 
-    def action_nav_last(self) -> None:
-        """Navigate to last task in column."""
+    def action_nav_to_task(self, index: int) -> None:
+        """Navigate to the first (0) or last (-1) task in the column."""
         screen = self.screen
         if isinstance(screen, BoardScreen):
-            screen.navigate_to_task(-1)
+            screen.navigate_to_task(index)
 
     # Task actions
     def action_new_task(self) -> None:
@@ -308,6 +396,8 @@ class SltasksApp(App):
         config = self.config_service.get_board_config()
         if config.types:
             # Show type selector modal
+            from .ui.widgets.type_selector import TypeSelectorModal
+
             self.push_screen(
                 TypeSelectorModal(config.types),
                 callback=self._handle_type_selection,
@@ -347,43 +437,31 @@ class SltasksApp(App):
 
         # Reload and refresh, focusing the new task
         self.board_service.reload()
-        screen.refresh_board(focus_task_id=task_id)
+        screen.refresh_board(focus_task_id=task_id, reload=False)
         self.notify("Task created", timeout=2)
 
-    def action_edit_task(self) -> None:
+    @_with_current_task
+    def action_edit_task(self, screen: BoardScreen, task: Task) -> None:
         """Edit the current task in external editor."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
         # Suspend TUI and open editor
         task_root = self.config_service.task_root
         with self.suspend():
             success = self.task_service.open_in_editor(task, task_root)
 
-        # Reload and refresh
+        # Only the edited task can have changed
         try:
-            self.board_service.reload()
-            screen.refresh_board()
+            self.board_service.reload_task(task.id)
+            screen.refresh_board(reload=False)
             if success:
                 self.notify("Task updated", timeout=2)
-        except GitHubClientError as e:
+        except github.GitHubClientError as e:
             logger.error("Failed to save task: %s", e)
             self.notify(f"Failed to save: {e}", severity="error", timeout=5)
 
-    def action_preview_task(self) -> None:
+    @_with_current_task
+    def action_preview_task(self, _screen: BoardScreen, task: Task) -> None:
         """Show task preview modal."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
+        from .ui.widgets.task_preview_modal import TaskPreviewModal
 
         task_root = self.config_service.task_root
         self.push_screen(  # pyrefly: ignore[no-matching-overload]
@@ -393,149 +471,81 @@ class SltasksApp(App):
 
     def _handle_preview_result(self, edit_requested: bool) -> None:
         """Handle preview modal result."""
-        if not edit_requested:
-            return
-
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
-        # Open in external editor
-        task_root = self.config_service.task_root
-        with self.suspend():
-            success = self.task_service.open_in_editor(task, task_root)
-
-        # Reload and refresh
-        try:
-            self.board_service.reload()
-            screen.refresh_board()
-            if success:
-                self.notify("Task updated", timeout=2)
-        except GitHubClientError as e:
-            logger.error("Failed to save task: %s", e)
-            self.notify(f"Failed to save: {e}", severity="error", timeout=5)
+        if edit_requested:
+            # Open in external editor
+            self.action_edit_task()
 
     def action_move_task_left(self) -> None:
         """Move current task to previous column."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
-        task_id = task.id
-        original_state = task.state  # Capture before modification (same object in cache)
-        try:
-            result = self.board_service.move_task_left(task_id)
-            if result is None:
-                self.notify("Cannot move task", severity="warning", timeout=2)
-            elif result.state != original_state:
-                screen.refresh_board(focus_task_id=task_id)
-                self.notify(f"Moved to {result.state.replace('_', ' ')}", timeout=2)
-            else:
-                self.notify("Already at first column", severity="information", timeout=2)
-        except GitHubClientError as e:
-            logger.error("Failed to move task left: %s", e)
-            self.notify(f"Failed to move: {e}", severity="error", timeout=5)
+        self._move_current_task_column(-1)
 
     def action_move_task_right(self) -> None:
         """Move current task to next column."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
+        self._move_current_task_column(1)
 
-        task = screen.get_current_task()
-        if task is None:
-            return
+    def action_move_task_up(self) -> None:
+        """Move current task up in column."""
+        self._reorder_current_task(-1)
+
+    def action_move_task_down(self) -> None:
+        """Move current task down in column."""
+        self._reorder_current_task(1)
 
+    @_with_current_task
+    def _move_current_task_column(self, screen: BoardScreen, task: Task, delta: int) -> None:
+        """Move the current task one column left (-1) or right (+1)."""
         task_id = task.id
         original_state = task.state  # Capture before modification (same object in cache)
+        direction = "left" if delta < 0 else "right"
         try:
-            result = self.board_service.move_task_right(task_id)
+            if delta < 0:
+                result = self.board_service.move_task_left(task_id)
+            else:
+                result = self.board_service.move_task_right(task_id)
             if result is None:
                 self.notify("Cannot move task", severity="warning", timeout=2)
             elif result.state != original_state:
                 screen.refresh_board(focus_task_id=task_id)
-                self.notify(f"Moved to {result.state.replace('_', ' ')}", timeout=2)
+                self.notify(f"Moved to {_state_label(result.state)}", timeout=2)
             else:
-                self.notify("Already at last column", severity="information", timeout=2)
-        except GitHubClientError as e:
-            logger.error("Failed to move task right: %s", e)
+                edge = "first" if delta < 0 else "last"
+                self.notify(f"Already at {edge} column", severity="information", timeout=2)
+        except github.GitHubClientError as e:
+            logger.error("Failed to move task %s: %s", direction, e)
             self.notify(f"Failed to move: {e}", severity="error", timeout=5)
 
-    def action_move_task_up(self) -> None:
-        """Move current task up in column."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
+    @_with_current_task
+    def _reorder_current_task(self, screen: BoardScreen, task: Task, delta: int) -> None:
+        """Move the current task up (-1) or down (+1) within its column."""
         task_id = task.id
+        direction = "up" if delta < 0 else "down"
         try:
-            if self.board_service.reorder_task(task_id, -1):
+            if self.board_service.reorder_task(task_id, delta):
                 screen.refresh_board(focus_task_id=task_id)
-                self.notify("Moved up", timeout=1)
+                self.notify(f"Moved {direction}", timeout=1)
             else:
-                self.notify("Already at top", severity="information", timeout=1)
-        except GitHubClientError as e:
+                edge = "top" if delta < 0 else "bottom"
+                self.notify(f"Already at {edge}", severity="information", timeout=1)
+        except github.GitHubClientError as e:
             logger.error("Failed to reorder task: %s", e)
             self.notify(f"Failed to reorder: {e}", severity="error", timeout=5)
 
-    def action_move_task_down(self) -> None:
-        """Move current task down in column."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
-        task_id = task.id
-        try:
-            if self.board_service.reorder_task(task_id, 1):
-                screen.refresh_board(focus_task_id=task_id)
-                self.notify("Moved down", timeout=1)
-            else:
-                self.notify("Already at bottom", severity="information", timeout=1)
-        except GitHubClientError as e:
-            logger.error("Failed to reorder task: %s", e)
-            self.notify(f"Failed to reorder: {e}", severity="error", timeout=5)
-
-    def action_archive_task(self) -> None:
+    @_with_current_task
+    def action_archive_task(self, screen: BoardScreen, task: Task) -> None:
         """Archive the current task."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
+        if self.board_service.archive_task(task.id) is None:
+            self.notify("Cannot archive task", severity="warning", timeout=2)
             return
 
-        self.board_service.archive_task(task.id)
         screen.refresh_board()
         self.notify("Task archived", timeout=2)
 
-    def action_delete_task(self) -> None:
+    @_with_current_task
+    def action_delete_task(self, _screen: BoardScreen, task: Task) -> None:
         """Delete the current task (with confirmation)."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
         # Show confirmation modal
+        from .ui.widgets.confirm_modal import ConfirmModal
+
         self.push_screen(  # pyrefly: ignore[no-matching-overload]
             ConfirmModal(f"Delete '{task.display_title}'?"),
             callback=self._handle_delete_confirm,
@@ -543,50 +553,37 @@ class SltasksApp(App):
 
     def _handle_delete_confirm(self, confirmed: bool) -> None:
         """Handle delete confirmation result."""
-        if not confirmed:
-            return
-
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
+        if confirmed:
+            self._delete_current_task()
 
-        task = screen.get_current_task()
-        if task:
-            self.task_service.delete_task(task.id)
-            screen.refresh_board()
-            self.notify("Task deleted", timeout=2)
+    @_with_current_task
+    def _delete_current_task(self, screen: BoardScreen, task: Task) -> None:
+        """Delete the focused task and refresh the board."""
+        self.task_service.delete_task(task.id)
+        screen.refresh_board()
+        self.notify("Task deleted", timeout=2)
 
-    def action_toggle_state(self) -> None:
+    @_with_current_task
+    def action_toggle_state(self, screen: BoardScreen, task: Task) -> None:
         """Toggle task state: cycles through columns in order, wrapping at end."""
-        screen = self.screen
-        if not isinstance(screen, BoardScreen):
-            return
-
-        task = screen.get_current_task()
-        if task is None:
-            return
-
         task_id = task.id
+        original_state = task.state
 
-        # Get column order from config
+        # Next state from the config's precomputed column cycle
         config = self.config_service.get_board_config()
-        column_ids = [col.id for col in config.columns]
-
-        # Find next state (cycle through columns)
-        try:
-            current_idx = column_ids.index(task.state)
-            next_idx = (current_idx + 1) % len(column_ids)
-            new_state = column_ids[next_idx]
-        except ValueError:
-            # Unknown state, move to first column
-            new_state = column_ids[0]
+        new_state = config.next_column_id(task.state)
 
-        self.board_service.move_task(task_id, new_state)
+        result = self.board_service.move_task(task_id, new_state)
+        if result is None:
+            self.notify("Cannot move task", severity="warning", timeout=2)
+            return
+        if result.state == original_state:
+            return  # Nothing changed, skip the board refresh
 
         # Focus follows task to its new column
         screen.refresh_board(focus_task_id=task_id)
 
-        self.notify(f"State: {new_state.replace('_', ' ')}", timeout=2)
+        self.notify(f"State: {_state_label(new_state)}", timeout=2)
 
     # Filter actions
     def action_enter_filter(self) -> None:
@@ -594,7 +591,7 @@ class SltasksApp(App):
         screen = self.screen
         if not isinstance(screen, BoardScreen):
             return
-        command_bar = screen.query_one(CommandBar)
+        command_bar = screen.command_bar
         command_bar.enter_filter_mode()
 
     def action_escape(self) -> None:
@@ -609,7 +606,7 @@ class SltasksApp(App):
         if not isinstance(screen, BoardScreen):
             return
 
-        command_bar = screen.query_one(CommandBar)
+        command_bar = screen.command_bar
         if command_bar.is_visible:
             # Exit filter input mode
             command_bar.exit_filter_mode()
@@ -623,10 +620,12 @@ class SltasksApp(App):
         if event.input.id == "filter-input":
             screen = self.screen
             if isinstance(screen, BoardScreen):
-                command_bar = screen.query_one(CommandBar)
-                command_bar.apply_filter(event.value)
-                command_bar.exit_filter_mode()
-                self._apply_filter(event.value)
+                command_bar = screen.command_bar
+                # Hide the input and reload the board in a single repaint
+                with self.batch_update():
+                    command_bar.apply_filter(event.value)
+                    command_bar.exit_filter_mode()
+                    self._apply_filter(event.value)
 
     def _apply_filter(self, expression: str) -> None:
         """Apply filter to the board."""
@@ -634,6 +633,9 @@ class SltasksApp(App):
         if not isinstance(screen, BoardScreen):
             return
 
+        if expression.strip() == screen.filter_expression:
+            return  # Filter unchanged, skip reloading the board
+
         if expression.strip():
             filter_ = self.filter_service.parse(expression)
             screen.set_filter(filter_, expression)
@@ -665,10 +667,7 @@ class SltasksApp(App):
     def _handle_sync_screen_close(self, _result: None) -> None:
         """Handle sync screen close - refresh the board."""
         # Refresh sync statuses and board after sync operations
-        self.refresh_sync_statuses()
-        screen = self.screen
-        if isinstance(screen, BoardScreen):
-            screen.refresh_board()
+        self._schedule_refresh(sync_statuses=True)
 
 
 def run(settings: Settings | None = None) -> None:
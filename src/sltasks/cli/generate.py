@@ -12,6 +12,9 @@ from .output import error, info, success
 
 logger = logging.getLogger(__name__)
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 CONFIG_FILE = "sltasks.yml"
 TEMPLATES_DIR = "templates"
 
@@ -123,9 +126,9 @@ def generate_config_yaml(task_root: str = ".tasks") -> str:
                 del priority_cfg["priority_alias"]
 
     # yaml.dump returns str when stream is None (which is our case)
-    yaml_content = yaml.dump(
-        config_dict, default_flow_style=False, sort_keys=False
-    )  # pyrefly: ignore[bad-assignment]
+    yaml_content = yaml.dump(  # pyrefly: ignore[bad-assignment]
+        config_dict, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+    )
     return CONFIG_HEADER + yaml_content  # pyrefly: ignore[unsupported-operation]
 
 
@@ -184,7 +187,7 @@ def run_generate(project_root: Path) -> int:
         info(f"Config exists: {config_path}")
         # Load existing config to get task_root
         with config_path.open() as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
         task_root_name = data.get("task_root", ".tasks")
     else:
         # Prompt for task directory name
@@ -1,6 +1,7 @@
 """Colorful CLI output helpers."""
 
 import sys
+from functools import cache
 
 # ANSI color codes
 GREEN = "\033[32m"
@@ -13,6 +14,7 @@ BULLET = "\u2022"  # •
 CROSS = "\u2717"  # ✗
 
 
+@cache
 def _supports_color() -> bool:
     """Check if terminal supports color output."""
     # Check if stdout is a TTY
@@ -26,16 +28,28 @@ def _colorize(text: str, color: str) -> str:
     return text
 
 
+@cache
+def _prefix(symbol: str, color: str) -> str:
+    """Build the (possibly colored) symbol prefix once per symbol."""
+    return f"{_colorize(symbol, color)} "
+
+
+def _write_line(prefix: str, message: str) -> None:
+    """Write prefix and message as one line to stdout."""
+    out = sys.stdout
+    out.write(prefix)
+    out.write(message)
+    out.write("\n")
+
+
 def success(message: str) -> None:
     """Print success message with green checkmark."""
-    check = _colorize(CHECK, GREEN)
-    print(f"{check} {message}")
+    _write_line(_prefix(CHECK, GREEN), message)
 
 
 def info(message: str) -> None:
     """Print info message with yellow bullet."""
-    bullet = _colorize(BULLET, YELLOW)
-    print(f"{bullet} {message}")
+    _write_line(_prefix(BULLET, YELLOW), message)
 
 
 def header(message: str) -> None:
@@ -45,5 +59,4 @@ def header(message: str) -> None:
 
 def error(message: str) -> None:
     """Print error message with red cross."""
-    cross = _colorize(CROSS, RED)
-    print(f"{cross} {message}")
+    _write_line(_prefix(CROSS, RED), message)
@@ -1,5 +1,24 @@
-"""GitHub integration for sltasks."""
+"""GitHub integration for sltasks.
 
-from sltasks.github.client import GitHubClient, GitHubClientError
+The client is resolved lazily on first access (PEP 562) so filesystem boards
+never import httpx.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .client import GitHubClient, GitHubClientError
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "GitHubClient": ".client",
+    "GitHubClientError": ".client",
+}
 
 __all__ = ["GitHubClient", "GitHubClientError"]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
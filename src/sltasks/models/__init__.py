@@ -1,37 +1,77 @@
-"""Data models."""
-
-from .board import Board, BoardOrder
-from .provider_data import (
-    FileProviderData,
-    GitHubProviderData,
-    GitHubPRProviderData,
-    JiraProviderData,
-    OptionalProviderData,
-    ProviderData,
-)
-from .sltasks_config import (
-    BoardConfig,
-    ColumnConfig,
-    GitHubConfig,
-    GitHubSyncConfig,
-    PriorityConfig,
-    SltasksConfig,
-    TypeConfig,
-)
-from .sync import (
-    ChangeSet,
-    Conflict,
-    PushResult,
-    SyncResult,
-    SyncStatus,
-)
-from .task import (
-    STATE_ARCHIVED,
-    STATE_DONE,
-    STATE_IN_PROGRESS,
-    STATE_TODO,
-    Task,
-)
+"""Data models.
+
+Names are resolved lazily on first access (PEP 562) so importing the package
+does not build every pydantic model up front.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .board import Board, BoardOrder
+    from .provider_data import (
+        FileProviderData,
+        GitHubProviderData,
+        GitHubPRProviderData,
+        JiraProviderData,
+        OptionalProviderData,
+        ProviderData,
+    )
+    from .sltasks_config import (
+        BoardConfig,
+        ColumnConfig,
+        GitHubConfig,
+        GitHubSyncConfig,
+        PriorityConfig,
+        SltasksConfig,
+        TypeConfig,
+    )
+    from .sync import (
+        ChangeSet,
+        Conflict,
+        PushResult,
+        SyncResult,
+        SyncStatus,
+    )
+    from .task import (
+        STATE_ARCHIVED,
+        STATE_DONE,
+        STATE_IN_PROGRESS,
+        STATE_TODO,
+        Task,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "Board": ".board",
+    "BoardOrder": ".board",
+    "FileProviderData": ".provider_data",
+    "GitHubProviderData": ".provider_data",
+    "GitHubPRProviderData": ".provider_data",
+    "JiraProviderData": ".provider_data",
+    "OptionalProviderData": ".provider_data",
+    "ProviderData": ".provider_data",
+    "BoardConfig": ".sltasks_config",
+    "ColumnConfig": ".sltasks_config",
+    "GitHubConfig": ".sltasks_config",
+    "GitHubSyncConfig": ".sltasks_config",
+    "PriorityConfig": ".sltasks_config",
+    "SltasksConfig": ".sltasks_config",
+    "TypeConfig": ".sltasks_config",
+    "ChangeSet": ".sync",
+    "Conflict": ".sync",
+    "PushResult": ".sync",
+    "SyncResult": ".sync",
+    "SyncStatus": ".sync",
+    "STATE_ARCHIVED": ".task",
+    "STATE_DONE": ".task",
+    "STATE_IN_PROGRESS": ".task",
+    "STATE_TODO": ".task",
+    "Task": ".task",
+}
 
 __all__ = [
     "STATE_ARCHIVED",
@@ -60,3 +100,5 @@ __all__ = [
     "Task",
     "TypeConfig",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
@@ -3,28 +3,85 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-
-from pydantic import BaseModel, Field
-
+import sys
+from collections.abc import Callable, Container
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from .sltasks_config import BoardConfig
 from .task import STATE_ARCHIVED, Task
 
 logger = logging.getLogger(__name__)
 
-if TYPE_CHECKING:
-    from .sltasks_config import BoardConfig
 
+@cache
+def _default_board_config() -> BoardConfig:
+    """Shared default config for boards built without one (built on first use)."""
+    return BoardConfig.default()
 
-class BoardOrder(BaseModel):
+
+@dataclass(slots=True)
+class BoardOrder:
     """Represents the ordering of tasks in tasks.yaml.
 
     The columns dict maps column IDs to lists of task IDs.
     For the filesystem repository, task IDs are filenames (e.g., "fix-bug.md").
     For other repositories, task IDs may be issue keys, numbers, etc.
+
+    A private task ID -> column ID index is kept alongside the column lists
+    so membership lookups don't scan every column. The mutating methods keep
+    it in sync; call reindex() after editing `columns` directly.
     """
 
     version: int = 1
-    columns: dict[str, list[str]] = Field(default_factory=dict)
+    columns: dict[str, list[str]] = field(default_factory=dict)
+
+    _index: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the task index from the initial columns."""
+        self.reindex()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BoardOrder:
+        """Create BoardOrder from parsed tasks.yaml data.
+
+        Empty columns (null in YAML) become empty lists; unknown keys are ignored.
+        """
+        columns = data.get("columns") or {}
+        return cls(
+            version=int(data.get("version", 1)),
+            columns={
+                str(col_id): [sys.intern(task_id) for task_id in task_ids or []]
+                for col_id, task_ids in columns.items()
+            },
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict suitable for writing tasks.yaml."""
+        return {
+            "version": self.version,
+            "columns": {col_id: list(task_ids) for col_id, task_ids in self.columns.items()},
+        }
+
+    def reindex(self) -> None:
+        """Rebuild the task -> column index from the column lists.
+
+        A task can only live in one column, so duplicate entries are dropped,
+        keeping the first occurrence.
+        """
+        index: dict[str, str] = {}
+        for column_id, task_ids in self.columns.items():
+            unique: list[str] = []
+            for task_id in task_ids:
+                if task_id not in index:
+                    index[task_id] = column_id
+                    unique.append(task_id)
+            if len(unique) != len(task_ids):
+                task_ids[:] = unique
+        self._index = index
 
     @classmethod
     def default(cls) -> BoardOrder:
@@ -45,23 +102,27 @@ class BoardOrder(BaseModel):
         for col in config.columns:
             columns[col.id] = []
         columns["archived"] = []
-        return cls(columns=columns)  # pyrefly: ignore[bad-argument-type]
+        return cls(columns=columns)
 
     def ensure_column(self, column_id: str) -> None:
         """Ensure a column exists in the order."""
         if column_id not in self.columns:
             self.columns[column_id] = []
 
+    def column_of(self, task_id: str) -> str | None:
+        """Get the column ID containing a task, or None if not present."""
+        return self._index.get(task_id)
+
     def get_position(self, task_id: str, state: str) -> int:
         """Get position of task in its column, or -1 if not found."""
-        column = self.columns.get(state, [])
-        try:
-            return column.index(task_id)
-        except ValueError:
+        if self._index.get(task_id) != state:
             return -1
+        return self.columns[state].index(task_id)
 
     def add_task(self, task_id: str, state: str, position: int = -1) -> None:
         """Add task to column at position (-1 = end)."""
+        # Share one string object with the Task's id (interned on validation)
+        task_id = sys.intern(task_id)
         self.ensure_column(state)
 
         # Remove from any existing column first
@@ -71,29 +132,59 @@ class BoardOrder(BaseModel):
             self.columns[state].append(task_id)
         else:
             self.columns[state].insert(position, task_id)
+        self._index[task_id] = state
 
     def remove_task(self, task_id: str) -> None:
-        """Remove task from all columns."""
-        for column in self.columns.values():
-            if task_id in column:
+        """Remove task from whichever column holds it."""
+        column_id = self._index.pop(task_id, None)
+        if column_id is None:
+            return
+        column = self.columns.get(column_id)
+        if column is not None:
+            with suppress(ValueError):
                 column.remove(task_id)
 
+    def retain_tasks(self, task_ids: Container[str]) -> bool:
+        """Drop every task not in `task_ids` in one pass per column.
+
+        Returns True if anything was removed.
+        """
+        removed = False
+        for column_id, column in self.columns.items():
+            kept = [task_id for task_id in column if task_id in task_ids]
+            if len(kept) != len(column):
+                for task_id in column:
+                    if task_id not in task_ids:
+                        self._index.pop(task_id, None)
+                self.columns[column_id] = kept
+                removed = True
+        return removed
+
     def move_task(self, task_id: str, _from_state: str, to_state: str, position: int = -1) -> None:
         """Move task between columns."""
-        self.remove_task(task_id)
+        # add_task already removes the task from its current column
         self.add_task(task_id, to_state, position)
 
+    def rename_task(self, old_task_id: str, new_task_id: str) -> None:
+        """Replace a task ID in place, keeping its column and position."""
+        column_id = self._index.pop(old_task_id, None)
+        if column_id is None:
+            return
+        new_task_id = sys.intern(new_task_id)
+        column = self.columns[column_id]
+        column[column.index(old_task_id)] = new_task_id
+        self._index[new_task_id] = column_id
 
-class Board(BaseModel):
+
+@dataclass(slots=True)
+class Board:
     """Full board state with tasks grouped by column."""
 
     # Dynamic columns storage
-    columns: dict[str, list[Task]] = Field(default_factory=dict)
+    columns: dict[str, list[Task]] = field(default_factory=dict)
 
     # Store config for visible_columns method
-    _config: BoardConfig | None = None
-
-    model_config = {"arbitrary_types_allowed": True}
+    _config: BoardConfig | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_tasks(cls, tasks: list[Task], config: BoardConfig | None = None) -> Board:
@@ -105,11 +196,8 @@ class Board(BaseModel):
             config: Board configuration for column definitions.
                     If None, uses default 3-column config.
         """
-        # Import here to avoid circular import
-        from .sltasks_config import BoardConfig as BC
-
         if config is None:
-            config = BC.default()
+            config = _default_board_config()
 
         board = cls()
         board._config = config
@@ -121,21 +209,27 @@ class Board(BaseModel):
         # Always have archived column
         board.columns[STATE_ARCHIVED] = []
 
+        # Pre-bind one append per status (column IDs, aliases, archived) so
+        # each task costs a single dict lookup
+        appenders: dict[str, Callable[[Task], None]] = {
+            column_id: column.append for column_id, column in board.columns.items()
+        }
+        for col in config.columns:
+            for alias in col.status_alias:
+                appenders[alias] = appenders[col.id]
+        # Unknown states are placed in the first column
+        default_append = appenders[config.columns[0].id]
+
         # Track unknown states for logging
         unknown_states: set[str] = set()
 
         # Sort tasks into columns
         for task in tasks:
-            # Resolve status to canonical column ID (handles aliases)
-            column_id = config.get_column_for_status(task.state)
-
-            if column_id is not None and column_id in board.columns:
-                board.columns[column_id].append(task)
-            else:
-                # Unknown state - place in first column
+            append = appenders.get(task.state)
+            if append is None:
                 unknown_states.add(task.state)
-                first_col = config.columns[0].id
-                board.columns[first_col].append(task)
+                append = default_append
+            append(task)
 
         # Log unknown states if any were found
         if unknown_states:
@@ -156,10 +250,7 @@ class Board(BaseModel):
         Returns:
             List of (column_id, title, tasks) tuples in display order.
         """
-        # Import here to avoid circular import
-        from .sltasks_config import BoardConfig as BC
-
         if config is None:
-            config = self._config or BC.default()
+            config = self._config or _default_board_config()
 
         return [(col.id, col.title, self.columns.get(col.id, [])) for col in config.columns]
@@ -11,7 +11,7 @@ type narrowing support.
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class FileProviderData(BaseModel):
@@ -22,9 +22,12 @@ class FileProviderData(BaseModel):
     - No additional fields needed
 
     This model exists primarily to identify file-based tasks
-    in the discriminated union.
+    in the discriminated union. It is frozen so a single instance can be
+    shared by every task loaded from disk.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     provider: Literal["file"] = "file"
 
 
@@ -1,13 +1,22 @@
 """Configuration models for sltasks.yml."""
 
+import re
+from collections.abc import Mapping
+from functools import cache, cached_property
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar, Self
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# The common all-ASCII identifier, accepted in one C-level match
+_ASCII_IDENTIFIER = re.compile(r"[a-z][a-z0-9_]*")
 
 
 def _validate_identifier(value: str, name: str = "ID") -> str:
     """Validate an identifier is lowercase alphanumeric with underscores."""
+    if _ASCII_IDENTIFIER.fullmatch(value):
+        return value
+    # Slow path: pick the specific error (or accept non-ASCII letters)
     if not value:
         raise ValueError(f"{name} cannot be empty")
     if not value[0].isalpha():
@@ -184,8 +193,26 @@ class PriorityConfig(BaseModel):
         return bool(self.canonical_alias and self.canonical_alias.lower() == label_lower)
 
 
+@cache
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    """Names of the cached_property attributes defined on a class and its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
 class BoardConfig(BaseModel):
-    """Configuration for board columns, task types, and priorities."""
+    """Configuration for board columns, task types, and priorities.
+
+    Frozen so the cached lookup tables below can't go stale in place; a
+    changed sltasks.yml produces a new instance, and model_copy() drops the
+    tables when fields are updated.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     columns: list[ColumnConfig] = Field(..., min_length=2, max_length=6)
     types: list[TypeConfig] = Field(default_factory=list)
@@ -277,10 +304,56 @@ class BoardConfig(BaseModel):
 
         return v
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the config, dropping the cached lookup tables if fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _cached_property_names(type(self)):
+                copied.__dict__.pop(name, None)
+        return copied
+
     @property
     def column_ids(self) -> list[str]:
         """List of column IDs in display order."""
-        return [col.id for col in self.columns]
+        return list(self._column_titles)
+
+    @cached_property
+    def _column_titles(self) -> dict[str, str]:
+        """Map column IDs to titles, in display order."""
+        return {col.id: col.title for col in self.columns}
+
+    @cached_property
+    def _status_columns(self) -> dict[str, str]:
+        """Map every column ID and status alias to its column ID.
+
+        Validation guarantees aliases never collide with IDs or each other.
+        """
+        mapping = {col.id: col.id for col in self.columns}
+        for col in self.columns:
+            mapping.update(dict.fromkeys(col.status_alias, col.id))
+        return mapping
+
+    @cached_property
+    def _types_by_id(self) -> dict[str, TypeConfig]:
+        """Map type IDs to their config."""
+        return {t.id: t for t in self.types}
+
+    @cached_property
+    def _priorities_by_id(self) -> dict[str, PriorityConfig]:
+        """Map priority IDs to their config."""
+        return {p.id: p for p in self.priorities}
+
+    @cached_property
+    def _priority_ranks(self) -> dict[str, int]:
+        """Map every priority ID and alias to its rank (position in the list).
+
+        Validation guarantees aliases never collide with IDs or each other.
+        """
+        ranks: dict[str, int] = {}
+        for rank, p in enumerate(self.priorities):
+            ranks[p.id] = rank
+            ranks.update(dict.fromkeys(p.priority_alias, rank))
+        return ranks
 
     @property
     def type_ids(self) -> list[str]:
@@ -292,19 +365,40 @@ class BoardConfig(BaseModel):
         """List of priority IDs in order (first = lowest priority)."""
         return [p.id for p in self.priorities]
 
+    @cached_property
+    def column_cycle(self) -> dict[str, str]:
+        """Map each column ID to the next one in display order, wrapping at the end.
+
+        Built once per config instance; a reloaded config gets a fresh table.
+        """
+        ids = tuple(col.id for col in self.columns)
+        return dict(zip(ids, ids[1:] + ids[:1], strict=True))
+
+    @cached_property
+    def column_neighbors(self) -> dict[str, tuple[str | None, str | None]]:
+        """Map each column ID to its (previous, next) column IDs, without wrapping.
+
+        The first column has no previous and the last has no next (None).
+        """
+        ids = [col.id for col in self.columns]
+        previous: list[str | None] = [None, *ids[:-1]]
+        following: list[str | None] = [*ids[1:], None]
+        return dict(zip(ids, zip(previous, following, strict=True), strict=True))
+
+    def next_column_id(self, status: str) -> str:
+        """Get the column after `status` in the cycle (first column if unknown)."""
+        return self.column_cycle.get(status, self.columns[0].id)
+
     def get_title(self, column_id: str) -> str:
         """Get display title for a column ID."""
-        for col in self.columns:
-            if col.id == column_id:
-                return col.title
+        title = self._column_titles.get(column_id)
+        if title is not None:
+            return title
         return column_id.replace("_", " ").title()
 
     def get_type(self, type_id: str) -> TypeConfig | None:
         """Get type config by ID."""
-        for t in self.types:
-            if t.id == type_id:
-                return t
-        return None
+        return self._types_by_id.get(type_id)
 
     def resolve_status(self, status: str) -> str:
         """
@@ -314,17 +408,8 @@ class BoardConfig(BaseModel):
         If status matches an alias, returns the column's primary ID.
         If status is unknown, returns it unchanged.
         """
-        # Check if it's already a column ID
-        if status in self.column_ids:
-            return status
-
-        # Check if it's an alias
-        for col in self.columns:
-            if status in col.status_alias:
-                return col.id
-
-        # Unknown status - return unchanged (let caller handle)
-        return status
+        # Column IDs map to themselves; unknown statuses are returned unchanged
+        return self._status_columns.get(status, status)
 
     def resolve_type(self, type_value: str) -> str:
         """
@@ -352,20 +437,10 @@ class BoardConfig(BaseModel):
 
         Returns None if status is not a valid column ID or alias.
         """
-        # Check if it's a column ID
-        if status in self.column_ids:
-            return status
-
-        # Check if it's "archived"
-        if status == "archived":
+        column_id = self._status_columns.get(status)
+        if column_id is None and status == "archived":
             return "archived"
-
-        # Check if it's an alias
-        for col in self.columns:
-            if status in col.status_alias:
-                return col.id
-
-        return None
+        return column_id
 
     def is_valid_status(self, status: str) -> bool:
         """Check if status is valid (column ID, alias, or 'archived')."""
@@ -379,10 +454,7 @@ class BoardConfig(BaseModel):
 
     def get_priority(self, priority_id: str) -> PriorityConfig | None:
         """Get priority config by ID."""
-        for p in self.priorities:
-            if p.id == priority_id:
-                return p
-        return None
+        return self._priorities_by_id.get(priority_id)
 
     def resolve_priority(self, priority_value: str) -> str:
         """
@@ -410,11 +482,7 @@ class BoardConfig(BaseModel):
 
         Lower values = lower priority. Returns -1 if not found.
         """
-        resolved = self.resolve_priority(priority_id)
-        try:
-            return self.priority_ids.index(resolved)
-        except ValueError:
-            return -1
+        return self._priority_ranks.get(priority_id, -1)
 
     def is_valid_priority(self, priority_value: str) -> bool:
         """Check if priority_value is a valid priority ID or alias."""
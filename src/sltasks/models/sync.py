@@ -75,3 +75,4 @@ class ChangeSet:
     to_pull: list[str] = field(default_factory=list)  # Task IDs to pull from GitHub
     to_push: list[str] = field(default_factory=list)  # Task IDs to push to GitHub
     conflicts: list[Conflict] = field(default_factory=list)  # Conflicts to resolve
+    synced: list[str] = field(default_factory=list)  # Synced task IDs found locally
@@ -1,8 +1,12 @@
 """Task domain model."""
 
+import sys
+from collections.abc import Mapping
 from datetime import datetime
+from functools import cached_property
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .provider_data import OptionalProviderData
 
@@ -18,6 +22,10 @@ class Task(BaseModel):
 
     This model is frozen (immutable) to prevent cache mutation bugs.
     Use task.model_copy(update={...}) to create modified copies.
+
+    Pydantic models can't use __slots__, so instead of shrinking the instance
+    the derived display_title is computed once per task and cached;
+    model_copy drops the cached value when fields are updated.
     """
 
     model_config = ConfigDict(frozen=True)
@@ -39,7 +47,13 @@ class Task(BaseModel):
     # Content
     body: str = ""  # Markdown content after front matter
 
-    @property
+    @field_validator("id")
+    @classmethod
+    def validate_id(cls, v: str) -> str:
+        """Intern IDs so tasks and board order columns share one string."""
+        return sys.intern(v)
+
+    @cached_property
     def display_title(self) -> str:
         """Title for display - uses ID if title not set."""
         if self.title:
@@ -50,6 +64,13 @@ class Task(BaseModel):
             display = display[:-3]
         return display.replace("-", " ").title()
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the task, recomputing cached derived values if fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("display_title", None)
+        return copied
+
     def to_frontmatter(self) -> dict:
         """Convert to dict suitable for YAML front matter."""
         data: dict = {}
@@ -96,8 +117,7 @@ class Task(BaseModel):
 
 def _parse_datetime(value: str | datetime | None) -> datetime | None:
     """Parse datetime from string or pass through."""
-    if value is None:
-        return None
-    if isinstance(value, datetime):
+    # YAML already parses unquoted ISO timestamps, so check that case first
+    if value is None or isinstance(value, datetime):
         return value
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
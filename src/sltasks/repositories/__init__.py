@@ -1,11 +1,31 @@
-"""Repository layer for data access."""
+"""Repository layer for data access.
 
-from .filesystem import FilesystemRepository
-from .github_projects import GitHubProjectsRepository
-from .protocol import RepositoryProtocol
+Repositories are resolved lazily on first access (PEP 562) so importing the
+package does not load every storage backend up front.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .filesystem import FilesystemRepository
+    from .github_projects import GitHubProjectsRepository
+    from .protocol import RepositoryProtocol
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "FilesystemRepository": ".filesystem",
+    "GitHubProjectsRepository": ".github_projects",
+    "RepositoryProtocol": ".protocol",
+}
 
 __all__ = [
     "FilesystemRepository",
     "GitHubProjectsRepository",
     "RepositoryProtocol",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
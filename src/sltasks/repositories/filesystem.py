@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import re
+import time
 from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import frontmatter
 import yaml
@@ -15,6 +19,34 @@ from ..models.sltasks_config import BoardConfig
 if TYPE_CHECKING:
     from ..services.config_service import ConfigService
 
+# Same fence python-frontmatter uses for YAML: a line of three or more dashes
+_FRONT_MATTER_FENCE = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_TASKS_YAML_HEADER = b"# Auto-generated - do not edit manually\n"
+# Carries no per-task data, so every file task shares one (frozen) instance
+_FILE_PROVIDER_DATA = FileProviderData()
+
+
+def _split_front_matter(text: str) -> tuple[dict[str, Any], str]:
+    """Split a task file into its YAML front matter and body.
+
+    Matches frontmatter.load() for the YAML files sltasks writes (stripped
+    text, dash fences, stripped body) without probing every handler format
+    or building a Post. Text without front matter is returned as the body.
+    """
+    text = text.strip()
+    if not _FRONT_MATTER_FENCE.match(text):
+        return {}, text
+
+    parts = _FRONT_MATTER_FENCE.split(text, 2)
+    if len(parts) < 3:
+        return {}, text
+
+    header, body = parts[1], parts[2]
+    metadata = yaml.load(header, Loader=_YAML_LOADER) if header.strip() else None
+    return (metadata if isinstance(metadata, dict) else {}), body.strip()
+
 
 class FilesystemRepository:
     """
@@ -26,6 +58,10 @@ class FilesystemRepository:
 
     TASKS_YAML = "tasks.yaml"
 
+    # Files modified this recently aren't cached: their mtime may not change
+    # on a second write within the filesystem's timestamp granularity
+    _RACY_WINDOW_NS = 2_000_000_000
+
     def __init__(self, task_root: Path, config_service: ConfigService | None = None) -> None:
         """
         Initialize repository.
@@ -37,7 +73,22 @@ class FilesystemRepository:
         self.task_root = task_root
         self._config_service = config_service
         self._tasks: dict[str, Task] = {}
+        # False until the directory is scanned; writes and reload() reset it
+        self._tasks_loaded = False
+        # Sorted result of the last get_all(), dropped whenever tasks or order change
+        self._sorted_snapshot: list[Task] | None = None
         self._board_order: BoardOrder | None = None
+        # (mtime_ns, size) of tasks.yaml when _board_order last matched it
+        self._board_order_stat: tuple[int, int] | None = None
+        # Bytes last written to tasks.yaml, to skip rewriting identical content
+        self._board_order_bytes: bytes | None = None
+        # Parsed task files keyed by filename, with the (mtime_ns, size, inode)
+        # they were parsed at; alias normalization is applied on each read
+        self._parse_cache: dict[str, tuple[tuple[int, int, int], Task]] = {}
+        self._directory_ready = False
+        # _scan_fingerprint() and board config as of the last directory scan
+        self._fingerprint: tuple[int, int, int, int] | None = None
+        self._loaded_config: BoardConfig | None = None
 
     def _get_board_config(self) -> BoardConfig:
         """Get board config, using default if no config service."""
@@ -46,24 +97,49 @@ class FilesystemRepository:
         return BoardConfig.default()
 
     def ensure_directory(self) -> None:
-        """Create the tasks directory if it doesn't exist."""
+        """Create the tasks directory if it doesn't exist.
+
+        Only touches the filesystem once between reloads.
+        """
+        if self._directory_ready:
+            return
         self.task_root.mkdir(parents=True, exist_ok=True)
+        self._directory_ready = True
+
+    def get_board_metadata(self) -> dict[str, Any]:
+        """Get board metadata.
+
+        Filesystem boards have no metadata beyond sltasks.yml.
+        """
+        return {}
 
     # --- Task Operations ---
 
     def get_all(self) -> list[Task]:
-        """Load and return all tasks from the filesystem."""
-        self._load_tasks()
+        """Load and return all tasks from the filesystem.
+
+        The directory is only rescanned after reload() or a write through
+        this repository; otherwise the tasks from the last scan are reused.
+        """
+        if self._tasks_loaded and self._sorted_snapshot is not None:
+            return list(self._sorted_snapshot)
+
+        if not self._tasks_loaded:
+            self._load_tasks()
         self._load_board_order()
         self._reconcile()
-        return self._sorted_tasks()
+        tasks = self._sorted_tasks()
+        if self._tasks_loaded:
+            self._sorted_snapshot = tasks
+        return list(tasks)
 
     def get_by_id(self, task_id: str) -> Task | None:
         """Load a single task by ID."""
-        filepath = self.task_root / task_id
-        if not filepath.exists():
-            return None
-        return self._parse_task_file(filepath)
+        return self._read_task_file(self.task_root / task_id)
+
+    def exists(self, task_id: str) -> bool:
+        """Check whether a task file exists, without parsing it."""
+        return (self.task_root / task_id).exists()
 
     def get_filepath(self, task: Task) -> Path:
         """Get the filesystem path for a task.
@@ -85,7 +161,7 @@ class FilesystemRepository:
 
         # Set provider data if not already set (task is immutable, create copy)
         if task.provider_data is None:
-            task = task.model_copy(update={"provider_data": FileProviderData()})
+            task = task.model_copy(update={"provider_data": _FILE_PROVIDER_DATA})
 
         # Build front matter document
         post = frontmatter.Post(task.body)
@@ -93,7 +169,69 @@ class FilesystemRepository:
 
         # Write file (sort_keys=False preserves original key order)
         with filepath.open("w") as f:
-            f.write(frontmatter.dumps(post, sort_keys=False))
+            f.write(frontmatter.dumps(post, sort_keys=False, Dumper=_YAML_DUMPER))
+        self._task_written(task)
+        return task
+
+    def update_state(self, task: Task, state: str, updated: datetime) -> Task:
+        """Move a task to a new state, rewriting only its state and updated lines.
+
+        `task` must be the task as just read from disk, so the rest of the
+        file is known to be current and is left byte for byte as it was.
+        Falls back to a full save() when the front matter doesn't have one
+        single-line entry for each key.
+        """
+        moved = task.model_copy(update={"state": state, "updated": updated})
+        if not self._patch_state_lines(self.get_filepath(moved), moved):
+            return self.save(moved)
+        self._task_written(moved)
+        return moved
+
+    def _patch_state_lines(self, filepath: Path, task: Task) -> bool:
+        """Replace the state and updated front matter lines in place.
+
+        Returns False, leaving the file untouched, if either key is missing,
+        repeated, or spans several lines. The file's line endings are kept.
+        """
+        if task.updated is None:
+            return False
+        try:
+            text = filepath.read_text(encoding="utf-8", newline="")
+        except OSError:
+            return False
+
+        fences = _FRONT_MATTER_FENCE.finditer(text)
+        opening, closing = next(fences, None), next(fences, None)
+        if opening is None or closing is None or text[: opening.start()].strip():
+            return False
+
+        values = {"state": task.state, "updated": task.updated.isoformat()}
+        lines = yaml.dump(values, Dumper=_YAML_DUMPER, sort_keys=False).splitlines()
+        header = text[opening.end() : closing.start()]
+        for key, line in zip(values, lines, strict=True):
+            header, count = re.subn(
+                rf"^{key}:[^\r\n]*", lambda _match, line=line: line, header, flags=re.MULTILINE
+            )
+            if count != 1:
+                return False
+
+        # A value that continued onto following lines would now be corrupt
+        patched = yaml.load(header, Loader=_YAML_LOADER)
+        if not isinstance(patched, dict) or any(patched.get(k) != v for k, v in values.items()):
+            return False
+
+        filepath.write_text(
+            text[: opening.end()] + header + text[closing.start() :],
+            encoding="utf-8",
+            newline="",
+        )
+        return True
+
+    def _task_written(self, task: Task) -> None:
+        """Drop cached reads of a task file just written and update the board order."""
+        self._parse_cache.pop(task.id, None)
+        self._tasks_loaded = False
+        self._sorted_snapshot = None
 
         # Update board order
         self._ensure_board_order()
@@ -101,13 +239,14 @@ class FilesystemRepository:
             self._board_order.add_task(task.id, task.state)
             self._save_board_order()
 
-        return task
-
     def delete(self, task_id: str) -> None:
         """Delete a task file from the filesystem."""
         filepath = self.task_root / task_id
         if filepath.exists():
             filepath.unlink()
+        self._parse_cache.pop(task_id, None)
+        self._tasks_loaded = False
+        self._sorted_snapshot = None
 
         # Remove from board order
         self._ensure_board_order()
@@ -126,6 +265,7 @@ class FilesystemRepository:
 
     def save_board_order(self, order: BoardOrder) -> None:
         """Save the board order to tasks.yaml."""
+        order.reindex()  # Callers may have edited columns directly
         self._board_order = order
         self._save_board_order()
 
@@ -151,12 +291,13 @@ class FilesystemRepository:
         if self._board_order is None:
             return False
 
-        column = self._board_order.columns.get(task.state, [])
-        if task_id not in column:
+        # Index lookup avoids scanning the column for membership
+        current_idx = self._board_order.get_position(task_id, task.state)
+        if current_idx < 0:
             return False
 
         # Bounds check
-        current_idx = column.index(task_id)
+        column = self._board_order.columns[task.state]
         new_idx = current_idx + delta
         if new_idx < 0 or new_idx >= len(column):
             return False
@@ -174,21 +315,59 @@ class FilesystemRepository:
         if self._board_order is None:
             return
 
-        # Find and replace the task ID in all columns
-        for column in self._board_order.columns.values():
-            for i, task_id in enumerate(column):
-                if task_id == old_task_id:
-                    column[i] = new_task_id
-                    break
-
+        self._board_order.rename_task(old_task_id, new_task_id)
         self._save_board_order()
+        self._tasks_loaded = False  # The task file was renamed on disk
+        self._sorted_snapshot = None
 
     # --- Reload Support ---
 
     def reload(self) -> None:
-        """Clear caches and reload from filesystem."""
-        self._tasks.clear()
-        self._board_order = None
+        """Clear caches and reload from filesystem.
+
+        The loaded tasks are kept if the directory fingerprint and board
+        config match the last scan, and the board order is kept if tasks.yaml
+        hasn't changed since it was last read or written, so refreshing an
+        unchanged board is a stat pass rather than a re-parse.
+        """
+        if not (
+            self._tasks_loaded
+            and self._fingerprint is not None
+            and self._fingerprint == self._scan_fingerprint()
+            and self._loaded_config == self._get_board_config()
+        ):
+            self._tasks.clear()
+            self._tasks_loaded = False
+            self._sorted_snapshot = None
+        self._directory_ready = False
+        self._revalidate_board_order()
+
+    def reload_task(self, task_id: str) -> None:
+        """Re-read one task file, keeping the rest of the last directory scan.
+
+        Used after a single file was edited outside the app, where a full
+        reload() would stat every task file again. Falls back to reload() if
+        the directory hasn't been scanned or the board config has changed.
+        """
+        config = self._get_board_config()
+        if not self._tasks_loaded or self._loaded_config != config:
+            self.reload()
+            return
+        task = self._read_task_file(self.task_root / task_id, config)
+        if task is None:
+            self._tasks.pop(task_id, None)
+        else:
+            self._tasks[task.id] = task
+        self._sorted_snapshot = None
+        self._revalidate_board_order()
+
+    def _revalidate_board_order(self) -> None:
+        """Drop the loaded board order if tasks.yaml changed on disk."""
+        if self._board_order_stat is None or self._board_order_stat != self._stat_board_order():
+            self._board_order = None
+            self._board_order_stat = None
+            self._board_order_bytes = None
+            self._sorted_snapshot = None
 
     def validate(self) -> tuple[bool, str | None]:
         """Validate filesystem repository configuration.
@@ -215,33 +394,105 @@ class FilesystemRepository:
         if not self.task_root.exists():
             return
 
+        # Taken before reading, so edits made during the scan show up next time
+        self._fingerprint = self._scan_fingerprint()
+        # One config lookup per scan rather than one per file
+        config = self._get_board_config()
+        self._loaded_config = config
         for filepath in self._iter_task_files():
-            task = self._parse_task_file(filepath)
+            task = self._read_task_file(filepath, config)
             if task:
                 self._tasks[task.id] = task
 
+        # Forget files that no longer exist
+        for task_id in self._parse_cache.keys() - self._tasks.keys():
+            del self._parse_cache[task_id]
+        self._tasks_loaded = True
+
+    def _scan_fingerprint(self) -> tuple[int, int, int, int] | None:
+        """Summarize the task files as (count, name hash, mtime sum, size sum).
+
+        Adding, removing, renaming or editing a task file changes at least one
+        part; tasks.yaml writes don't. Returns None when the directory is
+        missing or a file changed within the racy window, where equal
+        timestamps can't be trusted.
+        """
+        count = names = mtimes = sizes = newest = 0
+        try:
+            with os.scandir(self.task_root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".md") and not name.startswith(".") and entry.is_file():
+                        stat = entry.stat()
+                        count += 1
+                        names ^= hash(name)
+                        mtimes += stat.st_mtime_ns
+                        sizes += stat.st_size
+                        newest = max(newest, stat.st_mtime_ns)
+        except OSError:
+            return None
+        if newest >= time.time_ns() - self._RACY_WINDOW_NS:
+            return None
+        return (count, names, mtimes, sizes)
+
     def _iter_task_files(self) -> Iterator[Path]:
-        """Iterate over all .md files in the task root."""
-        yield from self.task_root.glob("*.md")
+        """Iterate over all .md files in the task root.
+
+        A single scandir pass filtered by name is cheaper than glob's pattern
+        matching; hidden files are skipped, as glob("*.md") does.
+        """
+        with os.scandir(self.task_root) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".md") and not name.startswith(".") and entry.is_file():
+                    yield self.task_root / name
+
+    def _read_task_file(self, filepath: Path, config: BoardConfig | None = None) -> Task | None:
+        """Read a task file, reusing the parsed task if the file is unchanged."""
+        try:
+            stat = filepath.stat()
+        except OSError:
+            self._parse_cache.pop(filepath.name, None)
+            return None
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        cached = self._parse_cache.get(filepath.name)
+        if cached is not None and cached[0] == key:
+            return self._normalize_state(cached[1], config)
+
+        task = self._parse_task_file(filepath, normalize=False)
+        if task is None:
+            self._parse_cache.pop(filepath.name, None)
+            return None
+        if stat.st_mtime_ns < time.time_ns() - self._RACY_WINDOW_NS:
+            self._parse_cache[filepath.name] = (key, task)
+        return self._normalize_state(task, config)
 
-    def _parse_task_file(self, filepath: Path) -> Task | None:
+    def _normalize_state(self, task: Task, config: BoardConfig | None = None) -> Task:
+        """Normalize an alias state to its canonical column ID."""
+        if config is None:
+            config = self._get_board_config()
+        canonical_state = config.resolve_status(task.state)
+        if canonical_state != task.state:
+            # Task is immutable, create copy with normalized state
+            # We don't save immediately - file keeps alias until next save
+            task = task.model_copy(update={"state": canonical_state})
+        return task
+
+    def _parse_task_file(self, filepath: Path, normalize: bool = True) -> Task | None:
         """Parse a single task file."""
         try:
-            post = frontmatter.load(filepath)  # pyrefly: ignore[bad-argument-type]
+            metadata, body = _split_front_matter(filepath.read_text(encoding="utf-8"))
             task = Task.from_frontmatter(
                 task_id=filepath.name,
-                metadata=post.metadata,
-                body=post.content,
-                provider_data=FileProviderData(),
+                metadata=metadata,
+                body=body,
+                provider_data=_FILE_PROVIDER_DATA,
             )
 
             # Normalize alias states to canonical column IDs
-            config = self._get_board_config()
-            canonical_state = config.resolve_status(task.state)
-            if canonical_state != task.state:
-                # Task is immutable, create copy with normalized state
-                # We don't save immediately - file keeps alias until next save
-                task = task.model_copy(update={"state": canonical_state})
+            if normalize:
+                task = self._normalize_state(task)
 
             return task
         except Exception:
@@ -266,8 +517,7 @@ class FilesystemRepository:
             return False
 
         try:
-            post = frontmatter.load(filepath)  # pyrefly: ignore[bad-argument-type]
-            metadata = dict(post.metadata)  # pyrefly: ignore[bad-argument-type]
+            metadata, _ = _split_front_matter(filepath.read_text(encoding="utf-8"))
             github_data = metadata.get("github", {})
             return isinstance(github_data, dict) and github_data.get("synced", False) is True
         except Exception:
@@ -280,9 +530,11 @@ class FilesystemRepository:
 
         yaml_path = self.task_root / self.TASKS_YAML
         if yaml_path.exists():
-            with yaml_path.open() as f:
-                data = yaml.safe_load(f) or {}
-            self._board_order = BoardOrder(**data)
+            stat = self._stat_board_order()
+            # Machine-written mapping of lists; libyaml parses it far faster
+            data = yaml.load(yaml_path.read_bytes(), Loader=_YAML_LOADER) or {}
+            self._board_order = BoardOrder.from_dict(data)
+            self._board_order_stat = stat
         else:
             # Create new board order from config (or default)
             config = self._get_board_config()
@@ -301,17 +553,50 @@ class FilesystemRepository:
             self._board_order.ensure_column("archived")
 
     def _save_board_order(self) -> None:
-        """Write tasks.yaml to disk."""
+        """Write tasks.yaml to disk.
+
+        The write is skipped when the serialized order matches what was last
+        written and the file hasn't been touched since.
+        """
         if self._board_order is None:
             return
+        self._sorted_snapshot = None  # Ordering may have changed
+
+        content = _TASKS_YAML_HEADER + yaml.dump(
+            self._board_order.to_dict(),
+            Dumper=_YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding="utf-8",
+        )
+        if (
+            content == self._board_order_bytes
+            and self._board_order_stat is not None
+            and self._board_order_stat == self._stat_board_order()
+        ):
+            return
 
         self.ensure_directory()
+        # Write a sibling file and rename it over tasks.yaml, so a crash or a
+        # concurrent reload never sees a half-written order
         yaml_path = self.task_root / self.TASKS_YAML
-
-        data = self._board_order.model_dump()
-        with yaml_path.open("w") as f:
-            f.write("# Auto-generated - do not edit manually\n")
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        tmp_path = yaml_path.with_name(f"{yaml_path.name}.tmp")
+        try:
+            tmp_path.write_bytes(content)
+            tmp_path.replace(yaml_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._board_order_bytes = content
+        self._board_order_stat = self._stat_board_order()
+
+    def _stat_board_order(self) -> tuple[int, int] | None:
+        """Get (mtime_ns, size) of tasks.yaml, or None if it is missing."""
+        try:
+            stat = (self.task_root / self.TASKS_YAML).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def _reconcile(self) -> None:
         """
@@ -326,49 +611,27 @@ class FilesystemRepository:
         if self._board_order is None:
             return
 
-        modified = False
-
-        # Get set of actual task filenames
-        actual_files = set(self._tasks.keys())
-
         # Remove references to missing files from yaml
-        for state, filenames in list(self._board_order.columns.items()):
-            for filename in filenames[:]:  # Copy list for safe iteration
-                if filename not in actual_files:
-                    self._board_order.columns[state].remove(filename)
-                    modified = True
-
-        # Add new files and fix misplaced files
-        all_in_yaml: set[str] = set()
-        for task_ids in self._board_order.columns.values():
-            all_in_yaml.update(task_ids)
+        modified = self._board_order.retain_tasks(self._tasks.keys())
 
+        # Add new files and fix misplaced files; the board order's index
+        # answers "which column is this in" without scanning the columns
         for task_id, task in self._tasks.items():
             state_value = task.state  # Now a string, no .value needed
+            current_column = self._board_order.column_of(task_id)
 
-            if task_id not in all_in_yaml:
+            if current_column is None:
                 # New file - add to appropriate column
                 self._board_order.add_task(task_id, state_value)
                 modified = True
-            else:
-                # Check if in wrong column (file state takes precedence)
-                current_column = self._find_task_column(task_id)
-                if current_column and current_column != state_value:
-                    self._board_order.move_task(task_id, current_column, state_value)
-                    modified = True
+            elif current_column != state_value:
+                # In wrong column (file state takes precedence)
+                self._board_order.move_task(task_id, current_column, state_value)
+                modified = True
 
         if modified:
             self._save_board_order()
 
-    def _find_task_column(self, task_id: str) -> str | None:
-        """Find which column a task is currently in."""
-        if self._board_order is None:
-            return None
-        for state, task_ids in self._board_order.columns.items():
-            if task_id in task_ids:
-                return state
-        return None
-
     def _sorted_tasks(self) -> list[Task]:
         """Return tasks sorted by their board order position."""
         if self._board_order is None:
@@ -378,19 +641,20 @@ class FilesystemRepository:
         config = self._get_board_config()
         column_ids = [col.id for col in config.columns] + ["archived"]
 
-        # Build a position map for sorting
-        position_map: dict[str, tuple[int, int]] = {}
-
-        for state_idx, state in enumerate(column_ids):
-            task_ids = self._board_order.columns.get(state, [])
-            for pos_idx, task_id in enumerate(task_ids):
-                position_map[task_id] = (state_idx, pos_idx)
-
-        def sort_key(task: Task) -> tuple[int, int, str]:
-            if task.id in position_map:
-                state_idx, pos_idx = position_map[task.id]
-                return (state_idx, pos_idx, task.id)
-            # Tasks not in yaml go to end
-            return (999, 999, task.id)
-
-        return sorted(self._tasks.values(), key=sort_key)
+        # The board order already lists tasks in display order, so walk it
+        # instead of sorting; reconcile keeps each task in a single column
+        tasks = self._tasks
+        ordered: list[Task] = []
+        for state in column_ids:
+            for task_id in self._board_order.columns.get(state, ()):
+                task = tasks.get(task_id)
+                if task is not None:
+                    ordered.append(task)
+
+        if len(ordered) < len(tasks):
+            # Tasks outside the configured columns go to the end, by ID
+            placed = {task.id for task in ordered}
+            ordered.extend(
+                sorted((t for t in tasks.values() if t.id not in placed), key=lambda t: t.id)
+            )
+        return ordered
@@ -94,6 +94,11 @@ class GitHubProjectsRepository:
             self._client = GitHubClient.from_environment(github_config.base_url)
         return self._client
 
+    @property
+    def client(self) -> GitHubClient:
+        """The GitHub client, created on first use; the sync engine shares it."""
+        return self._ensure_client()
+
     # --- RepositoryProtocol Implementation ---
 
     def get_all(self) -> list[Task]:
@@ -119,6 +124,12 @@ class GitHubProjectsRepository:
             return task.model_copy(deep=True)
         return None
 
+    def exists(self, task_id: str) -> bool:
+        """Check whether a task ID is in the loaded project items."""
+        if not self._tasks:
+            self.get_all()
+        return task_id in self._tasks
+
     def save(self, task: Task) -> Task:
         """Save a task (create or update)."""
         if task.provider_data is None:
@@ -130,6 +141,12 @@ class GitHubProjectsRepository:
         else:
             raise ValueError(f"Cannot save task with provider: {task.provider_data}")
 
+    def update_state(self, task: Task, state: str, updated: datetime) -> Task:
+        """Move a task to a new state by saving an updated copy."""
+        moved = task.model_copy(update={"state": state, "updated": updated})
+        self.save(moved)
+        return moved
+
     def delete(self, task_id: str) -> None:
         """Delete a task (close the issue)."""
         task = self.get_by_id(task_id)
@@ -250,6 +267,14 @@ class GitHubProjectsRepository:
         self._board_order = None
         # Keep project metadata - it doesn't change often
 
+    def reload_task(self, task_id: str) -> None:
+        """Reload after a task was edited.
+
+        Items are fetched as a whole project, so this reloads everything.
+        """
+        logger.debug("Task %s edited, reloading the project", task_id)
+        self.reload()
+
     def rename_in_board_order(self, old_task_id: str, new_task_id: str) -> None:
         """Rename a task in board order.
 
@@ -257,6 +282,21 @@ class GitHubProjectsRepository:
         """
         pass  # No-op for GitHub
 
+    def ensure_directory(self) -> None:
+        """Prepare local storage.
+
+        For GitHub, tasks live in the project, so there is nothing to create.
+        """
+        pass  # No-op for GitHub
+
+    def get_board_metadata(self) -> dict[str, Any]:
+        """Get board metadata for display.
+
+        Returns an empty dict, so the banner stays as configured; see
+        get_project_metadata() for the project details used by --github-setup.
+        """
+        return {}
+
     def validate(self) -> tuple[bool, str | None]:
         """Validate GitHub configuration and connectivity.
 
@@ -1,6 +1,7 @@
 """Repository protocol for task storage backends."""
 
-from typing import Protocol
+from datetime import datetime
+from typing import Any, Protocol
 
 from ..models import BoardOrder, Task
 
@@ -19,6 +20,21 @@ class RepositoryProtocol(Protocol):
     numbers (e.g., "#456").
     """
 
+    def ensure_directory(self) -> None:
+        """Prepare local storage for tasks.
+
+        Filesystem creates the tasks directory; remote providers do nothing.
+        """
+        ...
+
+    def get_board_metadata(self) -> dict[str, Any]:
+        """Get board-level metadata for display (e.g., "project_title").
+
+        Returns:
+            Metadata dict; empty if the provider has nothing to show.
+        """
+        ...
+
     def get_all(self) -> list[Task]:
         """Load all tasks from the backend.
 
@@ -38,6 +54,17 @@ class RepositoryProtocol(Protocol):
         """
         ...
 
+    def exists(self, task_id: str) -> bool:
+        """Check whether a task ID is taken, without loading the task.
+
+        Args:
+            task_id: The task identifier (e.g., "fix-bug.md", "PROJ-123")
+
+        Returns:
+            True if a task with this ID exists.
+        """
+        ...
+
     def save(self, task: Task) -> Task:
         """Create or update a task.
 
@@ -49,6 +76,19 @@ class RepositoryProtocol(Protocol):
         """
         ...
 
+    def update_state(self, task: Task, state: str, updated: datetime) -> Task:
+        """Move a task to a new state.
+
+        Args:
+            task: The task as currently loaded
+            state: The canonical state to move it to
+            updated: Timestamp to record as the task's last update
+
+        Returns:
+            The moved task.
+        """
+        ...
+
     def delete(self, task_id: str) -> None:
         """Delete a task by ID.
 
@@ -98,6 +138,16 @@ class RepositoryProtocol(Protocol):
         """
         ...
 
+    def reload_task(self, task_id: str) -> None:
+        """Reload a single task from source after it was edited.
+
+        Repositories that can't re-read one task reload everything.
+
+        Args:
+            task_id: The task that changed
+        """
+        ...
+
     def rename_in_board_order(self, old_task_id: str, new_task_id: str) -> None:
         """Rename a task in the board order.
 
@@ -1,10 +1,31 @@
-"""Service layer for business logic."""
+"""Service layer for business logic.
 
-from .board_service import BoardService
-from .config_service import ConfigService
-from .filter_service import Filter, FilterService
-from .task_service import TaskService
-from .template_service import TemplateService
+Services are resolved lazily on first access (PEP 562) so importing the
+package does not pull in YAML/front matter parsing until a service is used.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .board_service import BoardService
+    from .config_service import ConfigService
+    from .filter_service import Filter, FilterService
+    from .task_service import TaskService
+    from .template_service import TemplateService
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "BoardService": ".board_service",
+    "ConfigService": ".config_service",
+    "Filter": ".filter_service",
+    "FilterService": ".filter_service",
+    "TaskService": ".task_service",
+    "TemplateService": ".template_service",
+}
 
 __all__ = [
     "BoardService",
@@ -14,3 +35,5 @@ __all__ = [
     "TaskService",
     "TemplateService",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
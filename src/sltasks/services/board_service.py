@@ -55,23 +55,23 @@ class BoardService:
         if task is None:
             logger.debug("move_task: task not found: %s", task_id)
             return None
+        return self._move_loaded_task(task, to_state)
 
+    def _move_loaded_task(self, task: Task, to_state: str) -> Task:
+        """Move an already-loaded task, saving only if its state changes."""
+        task_id = task.id
         old_state = task.state
 
         # Resolve alias to canonical ID
         config = self._get_board_config()
         canonical_state = config.resolve_status(to_state)
 
-        # Create updated task (immutable model)
-        updated_task = task.model_copy(
-            update={
-                "state": canonical_state,
-                "updated": now_utc(),
-            }
-        )
+        if canonical_state == old_state:
+            # No-op move: skip the write so callers can detect "unchanged"
+            logger.debug("move_task: %s already in %s", task_id, canonical_state)
+            return task
 
-        # Save updates the file and yaml
-        self.repository.save(updated_task)
+        updated_task = self.repository.update_state(task, canonical_state, now_utc())
 
         logger.info("Task moved: %s (%s -> %s)", task_id, old_state, canonical_state)
         return updated_task
@@ -86,7 +86,8 @@ class BoardService:
         if new_state is None:
             return task  # Already at leftmost column
 
-        return self.move_task(task_id, new_state)
+        # Reuse the task just read rather than fetching it again
+        return self._move_loaded_task(task, new_state)
 
     def move_task_right(self, task_id: str) -> Task | None:
         """Move task to the next column (e.g., todo -> in_progress)."""
@@ -98,7 +99,8 @@ class BoardService:
         if new_state is None:
             return task  # Already at rightmost column
 
-        return self.move_task(task_id, new_state)
+        # Reuse the task just read rather than fetching it again
+        return self._move_loaded_task(task, new_state)
 
     def archive_task(self, task_id: str) -> Task | None:
         """Move a task to the archived state."""
@@ -115,7 +117,7 @@ class BoardService:
         config = self._get_board_config()
         first_column = config.columns[0].id
         logger.info("Unarchiving task: %s -> %s", task_id, first_column)
-        return self.move_task(task_id, first_column)
+        return self._move_loaded_task(task, first_column)
 
     def get_board_order(self) -> BoardOrder:
         """Get the current board order."""
@@ -141,26 +143,16 @@ class BoardService:
         """Reload board state from filesystem."""
         self.repository.reload()
 
+    def reload_task(self, task_id: str) -> None:
+        """Reload a single task after it was edited outside the app."""
+        self.repository.reload_task(task_id)
+
     def _previous_state(self, state: str) -> str | None:
         """Get the previous state in the workflow."""
-        config = self._get_board_config()
-        column_ids = [col.id for col in config.columns]
-        try:
-            idx = column_ids.index(state)
-            if idx > 0:
-                return column_ids[idx - 1]
-        except ValueError:
-            pass
-        return None
+        previous, _ = self._get_board_config().column_neighbors.get(state, (None, None))
+        return previous
 
     def _next_state(self, state: str) -> str | None:
         """Get the next state in the workflow."""
-        config = self._get_board_config()
-        column_ids = [col.id for col in config.columns]
-        try:
-            idx = column_ids.index(state)
-            if idx < len(column_ids) - 1:
-                return column_ids[idx + 1]
-        except ValueError:
-            pass
-        return None
+        _, following = self._get_board_config().column_neighbors.get(state, (None, None))
+        return following
@@ -9,6 +9,8 @@ from sltasks.models.sltasks_config import BoardConfig, SltasksConfig
 
 logger = logging.getLogger(__name__)
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigService:
     """Service for loading and caching application configuration."""
@@ -22,8 +24,12 @@ class ConfigService:
             project_root: Path to project root containing sltasks.yml
         """
         self.project_root = project_root
+        # Joined once; get_config stats it on every call
+        self._config_path = project_root / self.CONFIG_FILE
         self._config: SltasksConfig | None = None
         self._config_error: str | None = None
+        # (mtime_ns, size) of sltasks.yml when _config was loaded, None if missing
+        self._config_stat: tuple[int, int] | None = None
 
     @property
     def task_root(self) -> Path:
@@ -42,9 +48,11 @@ class ConfigService:
         return self._config_error
 
     def get_config(self) -> SltasksConfig:
-        """Get configuration, loading from file if not cached."""
-        if self._config is None:
+        """Get configuration, reloading it if sltasks.yml changed on disk."""
+        stat = self._stat_config()
+        if self._config is None or stat != self._config_stat:
             self._config = self._load_config()
+            self._config_stat = stat
         return self._config
 
     def get_board_config(self) -> BoardConfig:
@@ -65,10 +73,19 @@ class ConfigService:
         """Clear cached configuration, forcing reload on next access."""
         self._config = None
         self._config_error = None
+        self._config_stat = None
+
+    def _stat_config(self) -> tuple[int, int] | None:
+        """Get (mtime_ns, size) of sltasks.yml, or None if it is missing."""
+        try:
+            stat = self._config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def _load_config(self) -> SltasksConfig:
         """Load configuration from file or return default."""
-        config_path = self.project_root / self.CONFIG_FILE
+        config_path = self._config_path
         self._config_error = None
 
         if not config_path.exists():
@@ -77,7 +94,7 @@ class ConfigService:
 
         try:
             with config_path.open() as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
             if data is None:
                 self._config_error = f"{self.CONFIG_FILE} is empty"
@@ -1,6 +1,7 @@
 """Service for parsing and applying filters to tasks."""
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from ..models import Task
@@ -81,52 +82,61 @@ class FilterService:
 
     def apply(self, tasks: list[Task], filter_: Filter) -> list[Task]:
         """Apply filter to a list of tasks."""
-        result: list[Task] = []
-
-        for task in tasks:
-            if self._matches(task, filter_):
-                result.append(task)
-
-        return result
+        matches = self._compile(filter_)
+        return [task for task in tasks if matches(task)]
 
     def _matches(self, task: Task, f: Filter) -> bool:
         """Check if a task matches the filter."""
+        return self._compile(f)(task)
+
+    def _compile(self, f: Filter) -> Callable[[Task], bool]:
+        """
+        Build a predicate for the filter.
+
+        Lowercasing and set construction for the filter values happen once
+        here, and only the checks the filter actually uses are included, so
+        applying it to many tasks doesn't re-inspect the whole Filter per task.
+        """
+        checks: list[Callable[[Task], bool]] = []
+
         # Hide archived by default unless explicitly requested
-        if task.state == STATE_ARCHIVED and not f.show_archived:
-            return False
+        if not f.show_archived:
+            checks.append(lambda task: task.state != STATE_ARCHIVED)
 
         # Text search (case-insensitive)
         if f.text:
             search_text = f.text.lower()
-            title = task.display_title.lower()
-            body = task.body.lower()
-            if search_text not in title and search_text not in body:
-                return False
+            checks.append(
+                lambda task: (
+                    search_text in task.display_title.lower() or search_text in task.body.lower()
+                )
+            )
 
         # Tag inclusion (any match)
         if f.tags:
-            task_tags = [t.lower() for t in task.tags]
-            if not any(tag in task_tags for tag in f.tags):
-                return False
+            tags = frozenset(f.tags)
+            checks.append(lambda task: any(t.lower() in tags for t in task.tags))
 
         # Tag exclusion (no matches)
         if f.exclude_tags:
-            task_tags = [t.lower() for t in task.tags]
-            if any(tag in task_tags for tag in f.exclude_tags):
-                return False
+            exclude_tags = frozenset(f.exclude_tags)
+            checks.append(lambda task: not any(t.lower() in exclude_tags for t in task.tags))
 
         # State filter (any match)
-        if f.states and task.state not in f.states:
-            return False
+        if f.states:
+            states = frozenset(f.states)
+            checks.append(lambda task: task.state in states)
 
         # Priority filter (any match)
-        if f.priorities and task.priority not in f.priorities:
-            return False
+        if f.priorities:
+            priorities = frozenset(f.priorities)
+            checks.append(lambda task: task.priority in priorities)
 
         # Type filter (any match)
         if f.types:
-            task_type = (task.type or "").lower()
-            if task_type not in f.types:
-                return False
+            types = frozenset(f.types)
+            checks.append(lambda task: (task.type or "").lower() in types)
 
-        return True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda task: all(check(task) for check in checks)
@@ -478,7 +478,7 @@ class TaskService:
         candidate = filename
         counter = 1
 
-        while self.repository.get_by_id(candidate) is not None:
+        while self.repository.exists(candidate):
             candidate = f"{base}-{counter}.md"
             counter += 1
 
@@ -37,6 +37,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 PostPushAction = Literal["delete", "archive", "rename"]
 
@@ -85,6 +88,9 @@ class GitHubSyncEngine:
         # Cached current user (for @me filter expansion)
         self._current_user: str | None = None
 
+        # Whether the task directory has been created by this engine
+        self._task_root_ready = False
+
     def _get_github_config(self) -> GitHubConfig:
         """Get GitHub configuration."""
         config = self._config_service.get_config()
@@ -118,9 +124,9 @@ class GitHubSyncEngine:
             if not is_local_only_filename(filepath.name):
                 continue
 
-            task = self._parse_task_file(filepath)
-            if task is not None and not self._has_github_metadata(filepath):
-                tasks.append(task)
+            loaded = self._load_task_file(filepath)
+            if loaded is not None and not loaded[1]:
+                tasks.append(loaded[0])
 
         return tasks
 
@@ -312,6 +318,7 @@ class GitHubSyncEngine:
         - to_pull: Issues that need to be pulled (new or remote-modified)
         - to_push: Files that need to be pushed (local-modified with push_changes: true)
         - conflicts: Files where both local and remote changed
+        - synced: Every synced file found locally, whatever its status
 
         Returns:
             ChangeSet with lists of task IDs in each category
@@ -323,12 +330,15 @@ class GitHubSyncEngine:
             return changes
 
         try:
+            # Scanned before any API call, so synced is filled even if GitHub fails
+            existing_files = self._scan_synced_files()
+            changes.synced = [task.id for task in existing_files]
+
             current_user = self._get_current_user()
             all_issues = self._fetch_all_project_issues()
             filtered_issues = self._apply_filters(all_issues, current_user)
 
             # Build maps
-            existing_files = self._scan_synced_files()
             existing_by_key = {self._get_issue_key_from_task(task): task for task in existing_files}
             remote_by_key = {
                 self._get_issue_key_from_issue(issue): issue for issue in filtered_issues
@@ -826,8 +836,10 @@ class GitHubSyncEngine:
             filename = generate_synced_filename(owner, repo_name, issue_number, title)
             filepath = self._task_root / filename
 
-        # Ensure directory exists
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists (once per engine, not per pulled issue)
+        if not self._task_root_ready:
+            self._task_root.mkdir(parents=True, exist_ok=True)
+            self._task_root_ready = True
 
         # Build frontmatter
         board_config = self._get_board_config()
@@ -894,7 +906,7 @@ class GitHubSyncEngine:
         post.metadata = metadata
 
         with filepath.open("w") as f:
-            f.write(frontmatter.dumps(post, sort_keys=False))
+            f.write(frontmatter.dumps(post, sort_keys=False, Dumper=_YAML_DUMPER))
 
         # Update tasks.yaml
         self._add_to_tasks_yaml(filepath.name, state)
@@ -916,14 +928,19 @@ class GitHubSyncEngine:
             if not is_synced_filename(filepath.name):
                 continue
 
-            task = self._parse_task_file(filepath)
-            if task is not None and self._has_github_metadata(filepath):
-                tasks.append(task)
+            loaded = self._load_task_file(filepath)
+            if loaded is not None and loaded[1]:
+                tasks.append(loaded[0])
 
         return tasks
 
-    def _parse_task_file(self, filepath: Path) -> Task | None:
-        """Parse a single task file."""
+    def _load_task_file(self, filepath: Path) -> tuple[Task, bool] | None:
+        """Parse a task file, reading it once.
+
+        Returns:
+            (task, synced) where synced is True if the front matter has a
+            github: section with synced: true, or None if the file can't be parsed
+        """
         try:
             post = frontmatter.load(filepath)  # pyrefly: ignore[bad-argument-type]
             task = Task.from_frontmatter(
@@ -932,21 +949,13 @@ class GitHubSyncEngine:
                 body=post.content,
                 provider_data=FileProviderData(),
             )
-            return task
         except Exception as e:
             logger.warning("Failed to parse task file %s: %s", filepath, e)
             return None
 
-    def _has_github_metadata(self, filepath: Path) -> bool:
-        """Check if a task file has GitHub metadata in its frontmatter."""
-        try:
-            post = frontmatter.load(filepath)  # pyrefly: ignore[bad-argument-type]
-            # Check for github: section in frontmatter
-            metadata = dict(post.metadata)  # pyrefly: ignore[bad-argument-type]
-            github_data = metadata.get("github", {})
-            return isinstance(github_data, dict) and github_data.get("synced", False) is True
-        except Exception:
-            return False
+        github_data = post.metadata.get("github", {})
+        synced = isinstance(github_data, dict) and github_data.get("synced", False) is True
+        return task, synced
 
     def _get_github_metadata(self, task: Task) -> dict | None:
         """Get GitHub metadata from task's frontmatter."""
@@ -1031,7 +1040,7 @@ class GitHubSyncEngine:
             post.metadata["push_changes"] = False
 
             with filepath.open("w") as f:
-                f.write(frontmatter.dumps(post, sort_keys=False))
+                f.write(frontmatter.dumps(post, sort_keys=False, Dumper=_YAML_DUMPER))
 
         except Exception as e:
             logger.warning("Failed to update sync metadata for %s: %s", task.id, e)
@@ -1236,7 +1245,7 @@ class GitHubSyncEngine:
         post.metadata["updated"] = datetime.now(UTC).isoformat()
 
         with filepath.open("w") as f:
-            f.write(frontmatter.dumps(post, sort_keys=False))
+            f.write(frontmatter.dumps(post, sort_keys=False, Dumper=_YAML_DUMPER))
 
     def _add_to_tasks_yaml(self, task_id: str, state: str) -> None:
         """Add a task to tasks.yaml."""
@@ -1244,7 +1253,7 @@ class GitHubSyncEngine:
 
         if yaml_path.exists():
             with yaml_path.open() as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
         else:
             data = {"columns": {}}
 
@@ -1256,7 +1265,7 @@ class GitHubSyncEngine:
 
         with yaml_path.open("w") as f:
             f.write("# Auto-generated - do not edit manually\n")
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     def _remove_from_tasks_yaml(self, task_id: str) -> None:
         """Remove a task from tasks.yaml."""
@@ -1265,7 +1274,7 @@ class GitHubSyncEngine:
             return
 
         with yaml_path.open() as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         # Remove from all columns
         columns = data.get("columns", {})
@@ -1275,7 +1284,7 @@ class GitHubSyncEngine:
 
         with yaml_path.open("w") as f:
             f.write("# Auto-generated - do not edit manually\n")
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     def _rename_in_tasks_yaml(self, old_id: str, new_id: str) -> None:
         """Rename a task in tasks.yaml."""
@@ -1284,7 +1293,7 @@ class GitHubSyncEngine:
             return
 
         with yaml_path.open() as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         # Rename in all columns
         columns = data.get("columns", {})
@@ -1296,7 +1305,7 @@ class GitHubSyncEngine:
 
         with yaml_path.open("w") as f:
             f.write("# Auto-generated - do not edit manually\n")
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
 
 # Backward compatibility alias
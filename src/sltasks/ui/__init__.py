@@ -1,11 +1,31 @@
-"""UI components."""
+"""UI components.
 
-from .screens.board import BoardScreen
-from .widgets.column import KanbanColumn
-from .widgets.task_card import TaskCard
+Components are resolved lazily on first access (PEP 562) so importing a
+single screen or widget module doesn't load the board and its widgets first.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .screens.board import BoardScreen
+    from .widgets.column import KanbanColumn
+    from .widgets.task_card import TaskCard
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "BoardScreen": ".screens.board",
+    "KanbanColumn": ".widgets.column",
+    "TaskCard": ".widgets.task_card",
+}
 
 __all__ = [
     "BoardScreen",
     "KanbanColumn",
     "TaskCard",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
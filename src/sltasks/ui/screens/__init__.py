@@ -1,9 +1,28 @@
-"""Screen components."""
+"""Screen components.
 
-from .board import BoardScreen
-from .sync_screen import SyncScreen
+Screens are resolved lazily on first access (PEP 562) so starting on the
+board does not load the sync screen.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .board import BoardScreen
+    from .sync_screen import SyncScreen
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "BoardScreen": ".board",
+    "SyncScreen": ".sync_screen",
+}
 
 __all__ = [
     "BoardScreen",
     "SyncScreen",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
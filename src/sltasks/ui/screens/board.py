@@ -1,5 +1,7 @@
 """Main kanban board screen."""
 
+import operator
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.screen import Screen
@@ -12,6 +14,9 @@ from ...services import Filter
 from ..widgets.column import KanbanColumn
 from ..widgets.command_bar import CommandBar
 
+# Filter status bar text; the expression fills the slot
+_FILTER_STATUS_TEMPLATE = "[dim]Filter:[/] %s [dim](Esc to clear)[/]"
+
 
 class BoardScreen(Screen):
     """Main kanban board screen with navigation."""
@@ -24,10 +29,24 @@ class BoardScreen(Screen):
         self._current_column = 0
         self._current_task = 0
         self._filter: Filter | None = None
+        self._filter_expression = ""
         # Pending focus state for deferred focus after refresh
         self._pending_focus_task_id: str | None = None
         self._pending_column = 0
         self._pending_task = 0
+        # Widgets the app touches on every filter keystroke; held directly so
+        # lookups don't walk the DOM
+        self._filter_status = Static("", id="filter-status", classes="filter-status-bar")
+        self._filter_status_text = ""
+        self._command_bar = CommandBar()
+        # Column widgets in display order (and by column ID), filled by compose()
+        # so navigation indexes them instead of querying by CSS ID
+        self._columns: list[KanbanColumn] = []
+        self._columns_by_id: dict[str, KanbanColumn] = {}
+        # Column ID -> (filter, column tasks, filtered tasks) from the last load
+        self._filter_cache: dict[str, tuple[Filter, list[Task], list[Task]]] = {}
+        # Where each displayed task sits, filled by load_tasks()
+        self._task_positions: dict[str, tuple[int, int]] = {}
 
     @property
     def board_config(self) -> BoardConfig:
@@ -37,29 +56,34 @@ class BoardScreen(Screen):
     @property
     def column_ids(self) -> list[str]:
         """Get list of visible column IDs in order."""
-        return [col.id for col in self.board_config.columns]
+        return self.board_config.column_ids
 
     @property
     def column_count(self) -> int:
         """Number of visible columns."""
-        return len(self.column_ids)
+        return len(self.board_config.columns)
 
     def compose(self) -> ComposeResult:
         """Create the board layout with dynamic columns from config."""
         yield Header()
 
+        self._columns = []
+        self._columns_by_id = {}
         with Container(id="board-container"), Horizontal(id="columns"):
             for col in self.board_config.columns:
                 # Generate CSS-safe ID (replace underscores with hyphens)
                 col_id = f"column-{col.id.replace('_', '-')}"
-                yield KanbanColumn(
+                column = KanbanColumn(
                     title=col.title,
                     state=col.id,
                     id=col_id,
                 )
+                self._columns.append(column)
+                self._columns_by_id[col.id] = column
+                yield column
 
-        yield Static("", id="filter-status", classes="filter-status-bar")
-        yield CommandBar()
+        yield self._filter_status
+        yield self._command_bar
         yield Footer()
 
     def on_mount(self) -> None:
@@ -75,6 +99,8 @@ class BoardScreen(Screen):
     def set_filter(self, filter_: Filter | None, expression: str = "") -> None:
         """Set the active filter."""
         self._filter = filter_
+        self._filter_cache.clear()
+        self._filter_expression = expression.strip()
         self._update_filter_status(expression)
 
     def load_tasks(self) -> None:
@@ -86,36 +112,71 @@ class BoardScreen(Screen):
         if hasattr(self.app, "sync_statuses"):
             sync_statuses = self.app.sync_statuses  # pyrefly: ignore[missing-attribute]
 
-        # Populate each column using config
-        for col_id, _title, tasks in board.get_visible_columns(self.board_config):
-            # Apply filter if active
-            if self._filter:
-                tasks = self.app.filter_service.apply(  # pyrefly: ignore[missing-attribute]
-                    tasks, self._filter
-                )
+        # Task list per column in config order, with the filter applied if active
+        visible = board.get_visible_columns(self.board_config)
+        if self._filter:
+            filter_ = self._filter
+            column_tasks = [
+                (col_id, self._filtered_tasks(col_id, tasks, filter_))
+                for col_id, _, tasks in visible
+            ]
+        else:
+            column_tasks = [(col_id, tasks) for col_id, _, tasks in visible]
+
+        # Populate each column
+        for col_id, tasks in column_tasks:
+            column = self._columns_by_id.get(col_id)
+            if column is None:
+                # Column added to the config after the board was composed
+                self.log.warning(f"Column {col_id} is not on the board")
+                continue
+            column.set_tasks(tasks, sync_statuses)
 
-            widget_id = f"column-{col_id.replace('_', '-')}"
-            try:
-                column = self.query_one(f"#{widget_id}", KanbanColumn)
-                column.set_tasks(tasks, sync_statuses)
-            except Exception as e:
-                self.log.error(f"Failed to load column {widget_id}: {e}")
+        # Task ID -> (column index, task index), rebuilt whenever columns change
+        self._task_positions = {
+            task.id: (col_idx, task_idx)
+            for col_idx, column in enumerate(self._columns)
+            for task_idx, task in enumerate(column.tasks)
+        }
 
-    def refresh_board(self, focus_task_id: str | None = None) -> None:
+    def _filtered_tasks(self, col_id: str, tasks: list[Task], filter_: Filter) -> list[Task]:
+        """Apply the filter to a column's tasks, reusing the last result when nothing changed.
+
+        Tasks are immutable and the repository keeps the same objects until
+        a file changes, so an unchanged column holds the very same tasks.
+        """
+        cached = self._filter_cache.get(col_id)
+        if cached is not None:
+            cached_filter, source, filtered = cached
+            if (
+                cached_filter is filter_
+                and len(source) == len(tasks)
+                and all(map(operator.is_, source, tasks))
+            ):
+                return filtered
+        filtered = self.app.filter_service.apply(tasks, filter_)  # pyrefly: ignore[missing-attribute]
+        self._filter_cache[col_id] = (filter_, tasks, filtered)
+        return filtered
+
+    def refresh_board(self, focus_task_id: str | None = None, reload: bool = True) -> None:
         """
         Refresh the board display.
 
         Args:
             focus_task_id: If provided, focus this task after refresh.
                           If None, preserves current position.
+            reload: Reload the board service first. Pass False when the
+                    caller has just reloaded it.
         """
         # Save current position as fallback
         saved_column = self._current_column
         saved_task = self._current_task
 
-        # Reload data
-        self.app.board_service.reload()  # pyrefly: ignore[missing-attribute]
-        self.load_tasks()
+        # Reload data; batch so the column rebuilds repaint once
+        with self.app.batch_update():
+            if reload:
+                self.app.board_service.reload()  # pyrefly: ignore[missing-attribute]
+            self.load_tasks()
 
         # Store focus target for deferred application
         self._pending_focus_task_id = focus_task_id
@@ -140,14 +201,7 @@ class BoardScreen(Screen):
         Returns:
             (column_index, task_index) or None if not found
         """
-        for col_idx in range(self.column_count):
-            column = self._get_column(col_idx)
-            if column is None:
-                continue
-            for task_idx, task in enumerate(column.tasks):
-                if task.id == task_id:
-                    return (col_idx, task_idx)
-        return None
+        return self._task_positions.get(task_id)
 
     def _apply_pending_focus(self) -> None:
         """Apply pending focus after refresh completes."""
@@ -171,30 +225,25 @@ class BoardScreen(Screen):
 
     def navigate_column(self, delta: int) -> None:
         """Navigate between columns."""
-        new_column = self._current_column + delta
-
-        # Clamp to valid range
-        new_column = max(0, min(new_column, self.column_count - 1))
-
-        if new_column != self._current_column:
-            self._current_column = new_column
-            # Clamp task index to new column's task count
-            column = self._get_column(new_column)
-            if column and column.task_count > 0:
-                self._current_task = min(self._current_task, column.task_count - 1)
-            else:
-                self._current_task = 0
-            self._update_focus()
+        # Clamp to the composed columns; pressing against an edge is a no-op
+        new_column = max(0, min(self._current_column + delta, len(self._columns) - 1))
+        if new_column == self._current_column:
+            return
+
+        self._current_column = new_column
+        # Clamp task index to new column's task count
+        task_count = self._columns[new_column].task_count
+        self._current_task = min(self._current_task, task_count - 1) if task_count else 0
+        self._update_focus()
 
     def navigate_task(self, delta: int) -> None:
         """Navigate between tasks in current column."""
         column = self._get_column(self._current_column)
-        if column is None or column.task_count == 0:
+        if column is None:
             return
 
-        new_task = self._current_task + delta
-        new_task = max(0, min(new_task, column.task_count - 1))
-
+        # Clamp to the column; an empty column or an edge press is a no-op
+        new_task = max(0, min(self._current_task + delta, column.task_count - 1))
         if new_task != self._current_task:
             self._current_task = new_task
             self._update_focus()
@@ -212,14 +261,9 @@ class BoardScreen(Screen):
 
     def _get_column(self, index: int) -> KanbanColumn | None:
         """Get column widget by index."""
-        if index < 0 or index >= self.column_count:
-            return None
-        col_id = self.column_ids[index]
-        widget_id = f"column-{col_id.replace('_', '-')}"
-        try:
-            return self.query_one(f"#{widget_id}", KanbanColumn)
-        except Exception:
-            return None
+        if 0 <= index < len(self._columns):
+            return self._columns[index]
+        return None
 
     def _update_focus(self) -> None:
         """Update focus to current task."""
@@ -234,6 +278,16 @@ class BoardScreen(Screen):
             return column.get_task(self._current_task)
         return None
 
+    @property
+    def command_bar(self) -> CommandBar:
+        """Get the screen's command/filter bar."""
+        return self._command_bar
+
+    @property
+    def filter_expression(self) -> str:
+        """Get the active filter expression (empty when unfiltered)."""
+        return self._filter_expression
+
     @property
     def current_column_index(self) -> int:
         """Get the current column index."""
@@ -247,19 +301,18 @@ class BoardScreen(Screen):
     @property
     def current_column_state(self) -> str:
         """Get the state of the current column."""
-        if 0 <= self._current_column < self.column_count:
-            return self.column_ids[self._current_column]
-        return self.column_ids[0] if self.column_ids else "todo"
+        column = self._get_column(self._current_column)
+        if column is not None:
+            return column.state
+        column_ids = self.column_ids
+        return column_ids[0] if column_ids else "todo"
 
     def _update_filter_status(self, expression: str) -> None:
         """Update the filter status bar."""
-        try:
-            status = self.query_one("#filter-status", Static)
-            if expression.strip():
-                status.update(f"[dim]Filter:[/] {expression} [dim](Esc to clear)[/]")
-                status.display = True
-            else:
-                status.update("")
-                status.display = False
-        except Exception:
-            pass
+        text = _FILTER_STATUS_TEMPLATE % expression if expression.strip() else ""
+        if text == self._filter_status_text:
+            return
+        self._filter_status_text = text
+        status = self._filter_status
+        status.update(text)
+        status.display = bool(text)
@@ -1,13 +1,38 @@
-"""Widget components."""
+"""Widget components.
 
-from ..screens.help import HelpScreen
-from .column import EmptyColumnMessage, KanbanColumn
-from .command_bar import CommandBar
-from .confirm_modal import ConfirmModal
-from .push_confirm_modal import PushConfirmModal
-from .task_card import TaskCard
-from .task_preview_modal import TaskPreviewModal
-from .type_selector import TypeSelectorModal
+Widgets are resolved lazily on first access (PEP 562) so mounting the board
+does not load the modal screens, and the syntax highlighting behind the
+task preview, until one is opened.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from ..screens.help import HelpScreen
+    from .column import EmptyColumnMessage, KanbanColumn
+    from .command_bar import CommandBar
+    from .confirm_modal import ConfirmModal
+    from .push_confirm_modal import PushConfirmModal
+    from .task_card import TaskCard
+    from .task_preview_modal import TaskPreviewModal
+    from .type_selector import TypeSelectorModal
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "CommandBar": ".command_bar",
+    "ConfirmModal": ".confirm_modal",
+    "EmptyColumnMessage": ".column",
+    "HelpScreen": "..screens.help",
+    "KanbanColumn": ".column",
+    "PushConfirmModal": ".push_confirm_modal",
+    "TaskCard": ".task_card",
+    "TaskPreviewModal": ".task_preview_modal",
+    "TypeSelectorModal": ".type_selector",
+}
 
 __all__ = [
     "CommandBar",
@@ -20,3 +45,5 @@ __all__ = [
     "TaskPreviewModal",
     "TypeSelectorModal",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_IMPORTS)
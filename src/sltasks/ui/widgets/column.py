@@ -5,10 +5,11 @@ import re
 from textual.actions import SkipAction
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
-from textual.widget import Widget
+from textual.widget import AwaitMount, Widget
 from textual.widgets import Static
 
 from ...models import Task
+from ...models.sltasks_config import BoardConfig
 from ...models.sync import SyncStatus
 from .task_card import TaskCard
 
@@ -65,7 +66,22 @@ class EmptyColumnMessage(Static):
 
 
 class KanbanColumn(Widget):
-    """A single column in the kanban board."""
+    """A single column in the kanban board.
+
+    Only the cards that fit the viewport (plus an overscan margin) are
+    mounted up front. A spacer sized for the rest keeps the scrollbar
+    extent, and further cards are mounted as the column scrolls or when a
+    task past the mounted range is focused.
+
+    On refresh, cards whose task and sync status are unchanged are kept and
+    moved into the new order; only added or changed tasks get new cards, so
+    re-setting an unchanged task list doesn't touch the DOM.
+    """
+
+    # Smallest rows a card occupies (min-height 3 + 1 row margin)
+    MIN_CARD_ROWS = 4
+    # Extra cards mounted past the visible window
+    OVERSCAN = 5
 
     def __init__(
         self,
@@ -77,21 +93,38 @@ class KanbanColumn(Widget):
         super().__init__(*args, **kwargs)
         self.title = title
         self.state = state
+        # CSS-safe form of the state, computed once for the child IDs
+        self._state_css_id = state.replace("_", "-")
+        self._empty_text = f"No {state.replace('_', ' ')} tasks"
         self._tasks: list[Task] = []
+        # Bumped by set_tasks; the cards catch up when _refresh_tasks finishes.
+        # Until then self._cards is laid out for an older task list.
+        self._tasks_version = 0
+        self._cards_version = 0
         self._sync_statuses: dict[str, SyncStatus] = {}  # task_id -> status
-
-    @property
-    def _state_css_id(self) -> str:
-        """Get CSS-safe version of state for IDs."""
-        return self.state.replace("_", "-")
+        # Mounted cards, one per task in self._tasks[: len(self._cards)]
+        self._cards: list[TaskCard] = []
+        # Stands in for the unmounted cards so the scrollbar shows the full column
+        self._spacer: Static | None = None
+        self._empty_message: EmptyColumnMessage | None = None
+        # Config the mounted cards were built with
+        self._board_config: BoardConfig | None = None
+        # Task count the header currently shows
+        self._header_count = 0
+        # Child widgets held directly so refreshes and focus don't query the DOM
+        self._header = Static(
+            self._header_text, classes="column-header", id=f"header-{self._state_css_id}"
+        )
+        self._content = TaskListScroll(classes="column-content", id=f"content-{self._state_css_id}")
 
     def compose(self) -> ComposeResult:
         """Create column layout."""
-        yield Static(self._header_text, classes="column-header", id=f"header-{self._state_css_id}")
-        yield TaskListScroll(classes="column-content", id=f"content-{self._state_css_id}")
+        yield self._header
+        yield self._content
 
     def on_mount(self) -> None:
         """Refresh tasks when column is mounted."""
+        self.watch(self._content, "scroll_y", self._on_content_scroll, init=False)
         if self._tasks:
             self.call_after_refresh(self._refresh_tasks)
 
@@ -113,64 +146,183 @@ class KanbanColumn(Widget):
             sync_statuses: Optional dict mapping task_id -> SyncStatus
         """
         self._tasks = tasks
+        self._tasks_version += 1
         self._sync_statuses = sync_statuses or {}
         # Use call_after_refresh to ensure DOM is ready
         self.call_after_refresh(self._refresh_tasks)
 
     async def _refresh_tasks(self) -> None:
         """Refresh the task cards in this column."""
-        content_id = f"#content-{self._state_css_id}"
-        try:
-            content = self.query_one(content_id, TaskListScroll)
-        except Exception as e:
-            self.log.error(f"Cannot find {content_id}: {e}")
+        content = self._content
+        if not content.is_mounted:
             return
-
-        # Remove existing task cards and wait for removal to complete
-        await content.remove_children()
+        version = self._tasks_version
+
+        # Get board config for type lookups; cards built with another
+        # config are all rebuilt
+        board_config = None
+        if hasattr(self.app, "config_service"):
+            board_config = self.app.config_service.get_board_config()
+        reusable = self._reusable_cards() if board_config is self._board_config else {}
+        self._board_config = board_config
+
+        # Keep at least as many cards mounted as before, in the new task order
+        target = min(len(self._tasks), max(len(self._cards), self._window_size(content)))
+        cards: list[TaskCard] = []
+        kept: set[TaskCard] = set()
+        for task in self._tasks[:target]:
+            card = reusable.get(task.id)
+            if card is None:
+                card = self._make_card(task)
+            else:
+                kept.add(card)
+            cards.append(card)
+
+        # Remove the cards not carried over and wait, so a rebuilt card for
+        # the same task doesn't clash with the old one's ID
+        stale = [card for card in self._cards if card not in kept]
+        self._cards = cards
+        if stale:
+            await content.remove_children(stale)
 
         # Show empty state or task cards
         if not self._tasks:
-            state_name = self.state.replace("_", " ")
-            await content.mount(EmptyColumnMessage(f"No {state_name} tasks"))
+            if self._spacer is not None:
+                await self._spacer.remove()
+                self._spacer = None
+            if self._empty_message is None:
+                self._empty_message = EmptyColumnMessage(self._empty_text)
+                await content.mount(self._empty_message)
         else:
-            # Get board config for type lookups
-            board_config = None
-            if hasattr(self.app, "config_service"):
-                board_config = self.app.config_service.get_board_config()
-
-            for task in self._tasks:
-                # Generate CSS-safe ID from task ID
-                css_id = _task_css_id(task.id)
-
-                # Get type config if task has a type
-                type_config = None
-                if task.type and board_config:
-                    type_config = board_config.get_type(task.type)
-
-                # Get priority config for dynamic colors
-                priority_config = None
-                if board_config:
-                    priority_config = board_config.get_priority(task.priority)
-
-                # Get sync status for this task
-                sync_status = self._sync_statuses.get(task.id)
-
-                card = TaskCard(
-                    task,
-                    type_config=type_config,
-                    priority_config=priority_config,
-                    sync_status=sync_status,
-                    id=f"task-{css_id}",
-                )
-                await content.mount(card)
-
-        # Update header count
-        try:
-            header = self.query_one(f"#header-{self._state_css_id}", Static)
-            header.update(self._header_text)
-        except Exception:
-            pass
+            if self._empty_message is not None:
+                await self._empty_message.remove()
+                self._empty_message = None
+            pending = self._place_cards(content, kept)
+            # Resize (or add/drop) the spacer for the tasks past the mounted range
+            spacer_mount = self._mount_cards(content, target)
+            if spacer_mount is not None:
+                pending.append(spacer_mount)
+            for mount in pending:
+                await mount
+
+        # Update header count; unchanged counts skip the re-render
+        if len(self._tasks) != self._header_count:
+            self._header_count = len(self._tasks)
+            self._header.update(self._header_text)
+        self._cards_version = version
+
+    @property
+    def _cards_stale(self) -> bool:
+        """Whether the tasks changed since the cards were last laid out.
+
+        Cards are mounted by position, so nothing may be mounted until
+        _refresh_tasks has matched self._cards to self._tasks again.
+        """
+        return self._cards_version != self._tasks_version
+
+    def _window_size(self, content: TaskListScroll) -> int:
+        """Number of cards that fill the viewport, plus the overscan."""
+        return max(1, content.size.height // self.MIN_CARD_ROWS) + self.OVERSCAN
+
+    def _reusable_cards(self) -> dict[str, TaskCard]:
+        """Mounted cards whose task and sync status are unchanged, by task ID."""
+        tasks = {task.id: task for task in self._tasks}
+        return {
+            card.task.id: card
+            for card in self._cards
+            if tasks.get(card.task.id) == card.task
+            and card.sync_status == self._sync_statuses.get(card.task.id)
+        }
+
+    def _place_cards(self, content: TaskListScroll, kept: set[TaskCard]) -> list[AwaitMount]:
+        """Put the DOM in self._cards order, moving kept cards and mounting new ones.
+
+        Expects the content to hold only the kept cards (plus the spacer).
+        Returns the pending mounts for the new cards.
+        """
+        # Reorder the kept cards among themselves; they lead the children
+        reused = [card for card in self._cards if card in kept]
+        children = content.children
+        for index, card in enumerate(reused):
+            if children[index] is not card:
+                content.move_child(card, before=index)
+
+        # Mount each run of new cards just before the kept card that follows it
+        pending: list[AwaitMount] = []
+        run: list[TaskCard] = []
+        for card in self._cards:
+            if card not in kept:
+                run.append(card)
+            elif run:
+                pending.append(content.mount_all(run, before=card))
+                run = []
+        if run:
+            if self._spacer is not None:
+                pending.append(content.mount_all(run, before=self._spacer))
+            else:
+                pending.append(content.mount_all(run))
+        return pending
+
+    def _mount_cards(self, content: TaskListScroll, count: int) -> AwaitMount | None:
+        """Mount cards until the first `count` tasks have one, and resize the spacer.
+
+        Returns the pending mount (None if nothing was added). The new
+        cards are in the DOM straight away; awaiting waits for them to compose.
+        """
+        end = min(count, len(self._tasks))
+        cards = [self._make_card(task) for task in self._tasks[len(self._cards) : end]]
+        self._cards.extend(cards)
+
+        remaining = len(self._tasks) - len(self._cards)
+        # New cards (and a new spacer) go into the DOM in a single mount
+        widgets: list[Widget] = list(cards)
+        before = self._spacer
+        if remaining:
+            if self._spacer is None:
+                self._spacer = Static(classes="column-spacer")
+                widgets.append(self._spacer)
+            self._spacer.styles.height = remaining * self.MIN_CARD_ROWS
+        elif self._spacer is not None:
+            self._spacer.remove()
+            self._spacer = None
+            before = None
+
+        if not widgets:
+            return None
+        if before is not None:
+            return content.mount_all(widgets, before=before)
+        return content.mount_all(widgets)
+
+    def _make_card(self, task: Task) -> TaskCard:
+        """Build the card widget for a task."""
+        board_config = self._board_config
+
+        # Get type config if task has a type
+        type_config = None
+        if task.type and board_config:
+            type_config = board_config.get_type(task.type)
+
+        # Get priority config for dynamic colors
+        priority_config = None
+        if board_config and task.priority is not None:
+            priority_config = board_config.get_priority(task.priority)
+
+        return TaskCard(
+            task,
+            type_config=type_config,
+            priority_config=priority_config,
+            sync_status=self._sync_statuses.get(task.id),
+            # Generate CSS-safe ID from task ID
+            id=f"task-{_task_css_id(task.id)}",
+        )
+
+    def _on_content_scroll(self, scroll_y: float) -> None:
+        """Mount the next window of cards when scrolling nears the spacer."""
+        if self._spacer is None or self._cards_stale:
+            return
+        content = self._content
+        if content.max_scroll_y - scroll_y <= content.size.height:
+            self._mount_cards(content, len(self._cards) + self._window_size(content))
 
     @property
     def tasks(self) -> list[Task]:
@@ -194,17 +346,19 @@ class KanbanColumn(Widget):
         """
         if not self._tasks or index < 0 or index >= len(self._tasks):
             return False
-
-        task = self._tasks[index]
-        css_id = _task_css_id(task.id)
-        try:
-            card = self.query_one(f"#task-{css_id}", TaskCard)
-            card.focus()
-            card.scroll_visible()
-            return True
-        except Exception:
+        if self._cards_stale:
+            # Cards not yet rebuilt for a new task list
             return False
 
+        if index >= len(self._cards):
+            # Cards are in the DOM once mount() returns; focus is applied later
+            self._mount_cards(self._content, index + 1 + self.OVERSCAN)
+
+        card = self._cards[index]
+        card.focus()
+        card.scroll_visible()
+        return True
+
     def get_task(self, index: int) -> Task | None:
         """Get task at index."""
         if 0 <= index < len(self._tasks):
@@ -213,12 +367,4 @@ class KanbanColumn(Widget):
 
     def get_focused_task_index(self) -> int:
         """Get index of currently focused task, or -1."""
-        for i, task in enumerate(self._tasks):
-            css_id = _task_css_id(task.id)
-            try:
-                card = self.query_one(f"#task-{css_id}", TaskCard)
-                if card.has_focus:
-                    return i
-            except Exception:
-                pass
-        return -1
+        return next((i for i, card in enumerate(self._cards) if card.has_focus), -1)
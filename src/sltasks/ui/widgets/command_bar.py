@@ -49,21 +49,24 @@ class CommandBar(Widget):
     def __init__(self) -> None:
         super().__init__()
         self._active_filter: str = ""
+        # Inner widgets held directly so each filter action skips the DOM query
+        self._input = Input(
+            placeholder="tag:bug priority:high text...",
+            id="filter-input",
+            classes="filter-input",
+        )
+        self._status = Static("", id="filter-status", classes="filter-status")
 
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield Static("Filter:", id="mode-indicator", classes="mode-indicator")
-            yield Input(
-                placeholder="tag:bug priority:high text...",
-                id="filter-input",
-                classes="filter-input",
-            )
-            yield Static("", id="filter-status", classes="filter-status")
+            yield self._input
+            yield self._status
 
     def enter_filter_mode(self) -> None:
         """Enter filter input mode."""
         self.add_class("-visible")
-        input_widget = self.query_one("#filter-input", Input)
+        input_widget = self._input
         input_widget.value = self._active_filter
         input_widget.focus()
 
@@ -79,13 +82,12 @@ class CommandBar(Widget):
     def clear_filter(self) -> None:
         """Clear the active filter."""
         self._active_filter = ""
-        input_widget = self.query_one("#filter-input", Input)
-        input_widget.value = ""
+        self._input.value = ""
         self._update_status()
 
     def _update_status(self) -> None:
         """Update the status display."""
-        status = self.query_one("#filter-status", Static)
+        status = self._status
         if self._active_filter:
             status.update(f"[dim]Active: {self._active_filter}[/]")
         else:
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
@@ -11,6 +14,57 @@ from ...models import Task
 from ...models.sltasks_config import PriorityConfig, TypeConfig
 from ...models.sync import SyncStatus
 
+# First line that isn't blank or a heading; group 1 starts at its first non-space character
+_BODY_PREVIEW_RE = re.compile(r"^[^\S\n]*([^#\s][^\n]*)", re.MULTILINE)
+
+# Tags shown as chips before the rest collapse into "+N"
+_MAX_TAGS = 3
+
+
+@lru_cache(maxsize=2048)
+def _card_text(title: str, tags: tuple[str, ...]) -> tuple[str, str]:
+    """Build a card's title and tag chips.
+
+    Cards for the same task content are built again on every refresh that
+    changes it and as columns scroll, so the strings are cached. The body
+    preview is found per card and kept out of the key, so edited long
+    bodies aren't held by the cache.
+    """
+    return _truncate(title, 40), _format_tags(tags)
+
+
+@lru_cache(maxsize=256)
+def _badge(color: str, symbol: str, label: str) -> str:
+    """Render a colored symbol and label, e.g. a priority or type.
+
+    Only a handful of distinct priorities and types exist per board, so
+    every card after the first reuses the rendered string.
+    """
+    return f"[{color}]{symbol}[/] {label}"
+
+
+def _truncate(text: str, max_len: int) -> str:
+    """Truncate text with ellipsis."""
+    if len(text) <= max_len:
+        return text
+    return text[: max_len - 1] + "…"
+
+
+def _format_tags(tags: tuple[str, ...]) -> str:
+    """Format tags for display as chips."""
+    formatted = " ".join(f"[dim]#{tag}[/]" for tag in tags[:_MAX_TAGS])
+    if len(tags) > _MAX_TAGS:
+        formatted += f" [dim]+{len(tags) - _MAX_TAGS}[/]"
+    return formatted
+
+
+def _body_preview(body: str) -> str:
+    """Get first non-empty, non-heading line of body."""
+    match = _BODY_PREVIEW_RE.search(body)
+    if match is None:
+        return ""
+    return _truncate(match.group(1).rstrip(), 50)
+
 
 class TaskCard(Widget, can_focus=True):
     """A task card displayed in a column."""
@@ -23,6 +77,10 @@ class TaskCard(Widget, can_focus=True):
         SyncStatus.CONFLICT: ("⚠", "red"),
         SyncStatus.LOCAL_ONLY: ("○", "dim"),
     }
+    # Rendered markup per sync status, built once with the class
+    SYNC_STATUS_MARKUP: dict[SyncStatus, str] = {
+        status: f"[{color}]{symbol}[/]" for status, (symbol, color) in SYNC_STATUS_DISPLAY.items()
+    }
 
     def __init__(
         self,
@@ -44,10 +102,15 @@ class TaskCard(Widget, can_focus=True):
         """Get the task for this card."""
         return self._task_data
 
+    @property
+    def sync_status(self) -> SyncStatus | None:
+        """Get the sync status shown on this card."""
+        return self._sync_status
+
     def compose(self) -> ComposeResult:
         """Create card layout."""
-        # Title with truncation
-        title = self._truncate(self._task_data.display_title, 40)
+        task = self._task_data
+        title, tags_text = _card_text(task.display_title, tuple(task.tags))
         yield Static(title, classes="task-title")
 
         # Priority and type line (with optional sync indicator)
@@ -68,17 +131,15 @@ class TaskCard(Widget, can_focus=True):
             yield Static(priority_text, classes="task-priority")
 
         # Tags as chips
-        if self._task_data.tags:
-            yield Static(self._format_tags(), classes="task-tags")
+        if tags_text:
+            yield Static(tags_text, classes="task-tags")
 
         # Show assignee if present, otherwise body preview
         assignee = self._get_first_assignee()
         if assignee:
             yield Static(f"@{assignee}", classes="task-assignee")
-        elif self._task_data.body.strip():
-            preview = self._get_body_preview()
-            if preview:
-                yield Static(preview, classes="task-preview")
+        elif preview := _body_preview(task.body):
+            yield Static(preview, classes="task-preview")
 
     def _format_priority(self) -> str:
         """Format priority for display using config."""
@@ -96,49 +157,19 @@ class TaskCard(Widget, can_focus=True):
             color = "white"
             symbol = "●"
             label = self._task_data.priority
-        return f"[{color}]{symbol}[/] {label}"
+        return _badge(color, symbol, label)
 
     def _format_type(self) -> str:
         """Format type for display. Returns empty string if no type."""
         if not self._task_data.type or not self._type_config:
             return ""
-        return f"[{self._type_config.color}]●[/] {self._task_data.type}"
+        return _badge(self._type_config.color, "●", self._task_data.type)
 
     def _format_sync_indicator(self) -> str:
         """Format sync status indicator. Returns empty string if no sync status."""
         if self._sync_status is None:
             return ""
-        display = self.SYNC_STATUS_DISPLAY.get(self._sync_status)
-        if not display:
-            return ""
-        symbol, color = display
-        return f"[{color}]{symbol}[/]"
-
-    def _truncate(self, text: str, max_len: int) -> str:
-        """Truncate text with ellipsis."""
-        if len(text) <= max_len:
-            return text
-        return text[: max_len - 1] + "…"
-
-    def _format_tags(self) -> str:
-        """Format tags for display as chips."""
-        max_tags = 3
-        tags = self._task_data.tags[:max_tags]
-        formatted = " ".join(f"[dim]#{tag}[/]" for tag in tags)
-
-        if len(self._task_data.tags) > max_tags:
-            extra = len(self._task_data.tags) - max_tags
-            formatted += f" [dim]+{extra}[/]"
-
-        return formatted
-
-    def _get_body_preview(self) -> str:
-        """Get first non-empty, non-heading line of body."""
-        for line in self._task_data.body.split("\n"):
-            line = line.strip()
-            if line and not line.startswith("#"):
-                return self._truncate(line, 50)
-        return ""
+        return self.SYNC_STATUS_MARKUP.get(self._sync_status, "")
 
     def _get_first_assignee(self) -> str | None:
         """Get first assignee username if any."""
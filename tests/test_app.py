@@ -0,0 +1,175 @@
+"""Tests for SltasksApp class-level configuration."""
+
+import sys
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from sltasks.app import _PREWARM_MODULES, SltasksApp, _prewarm_imports
+from sltasks.models import ChangeSet
+from sltasks.models.sync import SyncStatus
+
+
+class TestAppBindings:
+    """Tests for the app key bindings."""
+
+    def test_comma_joined_keys_expand_to_each_key(self):
+        """Vim and arrow keys both resolve to the same navigation action."""
+        bindings = SltasksApp._merged_bindings
+        assert bindings is not None
+
+        for keys, action in [
+            (("h", "left"), "nav_column(-1)"),
+            (("j", "down"), "nav_task(1)"),
+            (("g", "home"), "nav_to_task(0)"),
+            (("H", "shift+left"), "move_task_left"),
+            (("J", "shift+down"), "move_task_down"),
+        ]:
+            for key in keys:
+                assert [b.action for b in bindings.key_to_bindings[key]] == [action]
+
+    def test_navigation_actions_forward_their_argument(self):
+        """Parameterised navigation actions pass the binding's argument to the board."""
+        app = SltasksApp.__new__(SltasksApp)
+        mock_screen = MagicMock()
+        with (
+            patch.object(SltasksApp, "screen", new_callable=PropertyMock, return_value=mock_screen),
+            patch("sltasks.app.isinstance", return_value=True),
+        ):
+            app.action_nav_column(-1)
+            app.action_nav_task(1)
+            app.action_nav_to_task(-1)
+
+        mock_screen.navigate_column.assert_called_once_with(-1)
+        mock_screen.navigate_task.assert_called_once_with(1)
+        mock_screen.navigate_to_task.assert_called_once_with(-1)
+
+    def test_escape_binding_has_priority(self):
+        """Escape must win over focused inputs to close filter mode."""
+        bindings = SltasksApp._merged_bindings
+        assert bindings is not None
+
+        (escape,) = bindings.key_to_bindings["escape"]
+        assert escape.priority is True
+
+
+class TestAppStylesheet:
+    """Tests for the app stylesheet location."""
+
+    def test_css_path_is_absolute_and_exists(self):
+        """CSS_PATH points at the packaged stylesheet without relative resolution."""
+        assert SltasksApp.CSS_PATH.is_absolute()
+        assert SltasksApp.CSS_PATH.is_file()
+
+
+class TestAppPrewarm:
+    """Tests for background import of the lazily loaded screens."""
+
+    def test_prewarm_modules_resolve(self):
+        """Every prewarmed module name imports relative to the package."""
+        _prewarm_imports(_PREWARM_MODULES)
+
+        for module_name in _PREWARM_MODULES:
+            assert f"sltasks{module_name}" in sys.modules
+
+
+class TestAppScheduledRefresh:
+    """Tests for coalescing board refreshes."""
+
+    def test_repeated_requests_refresh_once(self):
+        """Refreshes requested before the next tick run once, with sync if any asked."""
+        app = SltasksApp.__new__(SltasksApp)
+        app._refresh_pending = app._refresh_sync_pending = False
+        app._initial_sync_pending = False
+        app.call_later = MagicMock()
+        app.refresh_sync_statuses = MagicMock()
+
+        app._schedule_refresh()
+        app._schedule_refresh(sync_statuses=True)
+        app.call_later.assert_called_once_with(app._run_scheduled_refresh)
+
+        mock_screen = MagicMock()
+        with (
+            patch.object(SltasksApp, "screen", new_callable=PropertyMock, return_value=mock_screen),
+            patch("sltasks.app.isinstance", return_value=True),
+        ):
+            app._run_scheduled_refresh()
+
+        app.refresh_sync_statuses.assert_called_once_with()
+        mock_screen.refresh_board.assert_called_once_with()
+        assert not app._refresh_pending
+
+
+class TestAppSyncStatuses:
+    """Tests for building the sync status map."""
+
+    def test_change_categories_take_precedence(self):
+        """Conflicts beat pushes and pulls; untouched synced files are SYNCED."""
+        app = SltasksApp.__new__(SltasksApp)
+        app.sync_engine = MagicMock()
+        app.sync_engine.detect_changes.return_value = ChangeSet(
+            to_pull=["o/r#1.md", "o/r#3.md"],
+            to_push=["o/r#2.md", "local.md", "o/r#3.md"],
+            conflicts=[MagicMock(task_id="o/r#1.md")],
+            synced=["o/r#1.md", "o/r#2.md", "o/r#3.md", "o/r#4.md"],
+        )
+
+        app.refresh_sync_statuses()
+
+        assert app._sync_statuses == {
+            "o/r#1.md": SyncStatus.CONFLICT,
+            "o/r#2.md": SyncStatus.LOCAL_MODIFIED,
+            "o/r#3.md": SyncStatus.LOCAL_MODIFIED,
+            "o/r#4.md": SyncStatus.SYNCED,
+            "local.md": SyncStatus.LOCAL_ONLY,
+        }
+
+    def test_initial_detection_hands_statuses_to_main_thread(self):
+        """The startup worker returns its map to the main thread instead of assigning it."""
+        app = SltasksApp.__new__(SltasksApp)
+        statuses = {"o/r#1.md": SyncStatus.SYNCED}
+        app._detect_sync_statuses = MagicMock(return_value=statuses)
+        app.call_from_thread = MagicMock()
+
+        app._detect_initial_sync_statuses()
+
+        app.call_from_thread.assert_called_once_with(app._set_initial_sync_statuses, statuses)
+
+    def test_initial_statuses_stored_and_board_refreshed(self):
+        """The worker's statuses are stored on the main thread and the board refreshed."""
+        app = SltasksApp.__new__(SltasksApp)
+        app._initial_sync_pending = True
+        app._schedule_refresh = MagicMock()
+        statuses = {"o/r#1.md": SyncStatus.SYNCED}
+
+        app._set_initial_sync_statuses(statuses)
+
+        assert app._sync_statuses == statuses
+        assert not app._initial_sync_pending
+        app._schedule_refresh.assert_called_once_with()
+
+    def test_initial_statuses_dropped_after_main_thread_refresh(self):
+        """A detection on the main thread is newer than the worker's late result."""
+        app = SltasksApp.__new__(SltasksApp)
+        app.sync_engine = None
+        app._initial_sync_pending = True
+        app._schedule_refresh = MagicMock()
+
+        app.refresh_sync_statuses()
+        app._set_initial_sync_statuses({"o/r#1.md": SyncStatus.CONFLICT})
+
+        assert app._sync_statuses == {}
+        app._schedule_refresh.assert_not_called()
+
+    def test_scheduled_refresh_waits_for_initial_detection(self):
+        """Sync detection stays pending while the startup worker is running."""
+        app = SltasksApp.__new__(SltasksApp)
+        app._refresh_pending = True
+        app._refresh_sync_pending = True
+        app._initial_sync_pending = True
+        app.refresh_sync_statuses = MagicMock()
+
+        with patch.object(SltasksApp, "screen", new_callable=PropertyMock):
+            app._run_scheduled_refresh()
+
+        app.refresh_sync_statuses.assert_not_called()
+        assert app._refresh_sync_pending
+        assert not app._refresh_pending
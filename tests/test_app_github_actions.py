@@ -65,7 +65,7 @@ class TestActionEditTaskNotifications:
         app.task_service = MagicMock()
         app.task_service.open_in_editor.return_value = True
         app.board_service = MagicMock()
-        app.board_service.reload.side_effect = GitHubClientError("API rate limit exceeded")
+        app.board_service.reload_task.side_effect = GitHubClientError("API rate limit exceeded")
 
         # Mock screen with task
         mock_screen = MagicMock()
@@ -96,6 +96,35 @@ class TestBoardServiceMoveTask:
         reloaded = repo.get_by_id("task.md")
         assert reloaded.state == STATE_DONE
 
+    def test_move_task_to_same_state_skips_save(
+        self, board_service: BoardService, task_dir: Path, repo: FilesystemRepository
+    ):
+        """move_task to the current state returns the task without rewriting it."""
+        create_task_file(task_dir, "task.md", "todo")
+        original = (task_dir / "task.md").read_text()
+
+        with patch.object(repo, "save") as mock_save:
+            result = board_service.move_task("task.md", STATE_TODO)
+
+        assert result is not None
+        assert result.state == STATE_TODO
+        assert result.updated is None
+        mock_save.assert_not_called()
+        assert (task_dir / "task.md").read_text() == original
+
+    def test_move_task_right_reads_task_once(
+        self, board_service: BoardService, task_dir: Path, repo: FilesystemRepository
+    ):
+        """Directional moves read the task from the repository only once."""
+        create_task_file(task_dir, "task.md", "todo")
+
+        with patch.object(repo, "get_by_id", wraps=repo.get_by_id) as mock_get:
+            result = board_service.move_task_right("task.md")
+
+        assert result is not None
+        assert result.state == STATE_IN_PROGRESS
+        mock_get.assert_called_once_with("task.md")
+
     def test_move_task_left_from_in_progress(self, board_service: BoardService, task_dir: Path):
         """move_task_left moves in_progress to todo."""
         create_task_file(task_dir, "task.md", "in_progress")
@@ -260,3 +289,25 @@ class TestBoardServiceReorder:
         assert result is True
         # BoardService passes delta directly to repository
         mock_reorder.assert_called_once_with("task2.md", -1)
+
+
+class TestBoardServiceReloadTask:
+    """Tests for reloading a single task."""
+
+    def test_reload_task_rereads_edited_task(self, board_service: BoardService, task_dir: Path):
+        """An edited task shows up in the next board load."""
+        create_task_file(task_dir, "task.md", "todo")
+        board_service.load_board()
+
+        create_task_file(task_dir, "task.md", "done")
+        board_service.reload_task("task.md")
+
+        board = board_service.load_board()
+        assert [t.id for t in board.columns[STATE_DONE]] == ["task.md"]
+
+    def test_reload_task_delegates_to_repository(self, board_service: BoardService):
+        """The repository decides how much to re-read for one task."""
+        with patch.object(board_service, "repository") as mock_repo:
+            board_service.reload_task("task.md")
+
+        mock_repo.reload_task.assert_called_once_with("task.md")
@@ -0,0 +1,177 @@
+"""Tests for the kanban column widget, driven through the app."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from textual.pilot import Pilot
+
+from sltasks.app import SltasksApp
+from sltasks.config import Settings
+from sltasks.models.sync import SyncStatus
+from sltasks.ui.screens.board import BoardScreen
+from sltasks.ui.widgets.column import KanbanColumn
+from sltasks.ui.widgets.task_card import TaskCard
+
+
+def _write_tasks(project: Path, count: int, state: str = "todo") -> None:
+    """Write `count` task files named t0.md, t1.md, ... in the given state."""
+    task_dir = project / ".tasks"
+    task_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (task_dir / f"t{i}.md").write_text(f"---\ntitle: Task {i}\nstate: {state}\n---\nBody {i}\n")
+
+
+def _run(project: Path, scenario: Callable[[SltasksApp, Pilot], Awaitable[None]]) -> None:
+    """Run the app on a project and play the scenario against it."""
+
+    async def main() -> None:
+        app = SltasksApp(Settings(project_root=project))
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(pilot)
+            assert isinstance(app.screen, BoardScreen)
+            await scenario(app, pilot)
+
+    asyncio.run(main())
+
+
+async def _settle(pilot: Pilot) -> None:
+    """Let deferred column refreshes and focus updates run."""
+    for _ in range(4):
+        await pilot.pause()
+
+
+def _column(app: SltasksApp, state: str) -> KanbanColumn:
+    """The board column for a state."""
+    return app.screen.query_one(f"#column-{state.replace('_', '-')}", KanbanColumn)
+
+
+def _mounted_ids(column: KanbanColumn) -> list[str]:
+    """Task IDs of the cards mounted in a column, in DOM order."""
+    return [card.task.id for card in column.query(TaskCard)]
+
+
+def _cards_by_id(column: KanbanColumn) -> dict[str, TaskCard]:
+    """Mounted cards in a column, by task ID."""
+    return {card.task.id: card for card in column.query(TaskCard)}
+
+
+def _assert_cards_match_tasks(column: KanbanColumn) -> None:
+    """Mounted cards are unique and follow the column's task order."""
+    mounted = _mounted_ids(column)
+    assert len(mounted) == len(set(mounted))
+    assert mounted == [task.id for task in column.tasks[: len(mounted)]]
+
+
+class TestColumnFocusDuringRefresh:
+    """Focus requests that arrive before the column rebuilds its cards."""
+
+    def test_filter_round_trip_from_last_card(self, tmp_path: Path):
+        """Jumping to the last card, filtering, then clearing doesn't duplicate cards."""
+        _write_tasks(tmp_path, 120)
+
+        async def scenario(app: SltasksApp, pilot: Pilot) -> None:
+            await pilot.press("G")
+            await _settle(pilot)
+            await pilot.press("slash", *"Task 1", "enter")
+            await _settle(pilot)
+            await pilot.press("escape")
+            await _settle(pilot)
+
+            column = _column(app, "todo")
+            assert column.task_count == 120
+            _assert_cards_match_tasks(column)
+
+        _run(tmp_path, scenario)
+
+
+class TestColumnCardReuse:
+    """Cards for unchanged tasks are kept across refreshes and moved into order."""
+
+    def test_reorder_moves_existing_cards(self, tmp_path: Path):
+        """Moving a task down swaps the two cards without rebuilding either."""
+        _write_tasks(tmp_path, 5)
+
+        async def scenario(app: SltasksApp, pilot: Pilot) -> None:
+            column = _column(app, "todo")
+            before = _cards_by_id(column)
+            first, second = _mounted_ids(column)[:2]
+
+            await pilot.press("J")
+            await _settle(pilot)
+
+            assert _mounted_ids(column)[:2] == [second, first]
+            _assert_cards_match_tasks(column)
+            assert all(before[task_id] is card for task_id, card in _cards_by_id(column).items())
+
+        _run(tmp_path, scenario)
+
+    def test_filter_on_and_off_keeps_matching_cards(self, tmp_path: Path):
+        """Filtering drops the other cards; clearing restores them in board order."""
+        _write_tasks(tmp_path, 12)
+
+        async def scenario(app: SltasksApp, pilot: Pilot) -> None:
+            column = _column(app, "todo")
+            before = _cards_by_id(column)
+            all_ids = _mounted_ids(column)
+
+            await pilot.press("slash", *"Task 1", "enter")
+            await _settle(pilot)
+
+            filtered = _cards_by_id(column)
+            assert sorted(filtered) == ["t1.md", "t10.md", "t11.md"]
+            _assert_cards_match_tasks(column)
+            assert all(before[task_id] is card for task_id, card in filtered.items())
+
+            await pilot.press("escape")
+            await _settle(pilot)
+
+            assert _mounted_ids(column) == all_ids
+            _assert_cards_match_tasks(column)
+            restored = _cards_by_id(column)
+            assert all(restored[task_id] is card for task_id, card in filtered.items())
+
+        _run(tmp_path, scenario)
+
+    def test_move_between_columns(self, tmp_path: Path):
+        """A task moved right leaves its column and gets a card in the next one."""
+        _write_tasks(tmp_path, 3)
+
+        async def scenario(app: SltasksApp, pilot: Pilot) -> None:
+            todo = _column(app, "todo")
+            in_progress = _column(app, "in_progress")
+            before = _cards_by_id(todo)
+            moved = _mounted_ids(todo)[0]
+
+            await pilot.press("L")
+            await _settle(pilot)
+
+            assert moved not in _mounted_ids(todo)
+            assert _mounted_ids(in_progress) == [moved]
+            assert _cards_by_id(in_progress)[moved].task.state == "in_progress"
+            _assert_cards_match_tasks(todo)
+            assert all(before[task_id] is card for task_id, card in _cards_by_id(todo).items())
+
+        _run(tmp_path, scenario)
+
+    def test_sync_status_change_rebuilds_only_that_card(self, tmp_path: Path):
+        """A new sync status replaces the task's card; the others are kept."""
+        _write_tasks(tmp_path, 3)
+
+        async def scenario(app: SltasksApp, pilot: Pilot) -> None:
+            column = _column(app, "todo")
+            before = _cards_by_id(column)
+
+            app._sync_statuses = {"t1.md": SyncStatus.CONFLICT}
+            assert isinstance(app.screen, BoardScreen)
+            app.screen.refresh_board(reload=False)
+            await _settle(pilot)
+
+            after = _cards_by_id(column)
+            assert after["t1.md"] is not before["t1.md"]
+            assert after["t1.md"].sync_status == SyncStatus.CONFLICT
+            assert after["t0.md"] is before["t0.md"]
+            assert after["t2.md"] is before["t2.md"]
+            _assert_cards_match_tasks(column)
+
+        _run(tmp_path, scenario)
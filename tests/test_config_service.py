@@ -1,6 +1,7 @@
 """Tests for ConfigService."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -302,6 +303,29 @@ class TestConfigServiceCaching:
 
         assert config1 is config2
 
+    def test_unchanged_file_stays_cached(self, project_dir: Path):
+        """An unchanged sltasks.yml is not re-parsed."""
+        (project_dir / "sltasks.yml").write_text("version: 1\nbanner: Cached\n")
+        service = ConfigService(project_dir)
+        config1 = service.get_config()
+
+        with patch.object(service, "_load_config") as mock_load:
+            config2 = service.get_config()
+
+        mock_load.assert_not_called()
+        assert config1 is config2
+
+    def test_deleted_file_falls_back_to_defaults(self, project_dir: Path):
+        """Removing sltasks.yml switches back to the default config."""
+        config_file = project_dir / "sltasks.yml"
+        config_file.write_text("version: 1\nbanner: Custom\n")
+        service = ConfigService(project_dir)
+        assert service.get_banner() == "Custom"
+
+        config_file.unlink()
+
+        assert service.get_banner() == "sltasks"
+
     def test_reload_clears_cache(self, project_dir: Path):
         """reload() clears cached config."""
         service = ConfigService(project_dir)
@@ -335,9 +359,9 @@ board:
 """
         )
 
-        # Still cached
+        # Picked up without reload since the file changed
         config2 = service.get_config()
-        assert len(config2.board.columns) == 3
+        assert len(config2.board.columns) == 2
 
         # After reload
         service.reload()
@@ -195,9 +195,10 @@ board:
       title: "B"
 """)
 
-        # Still cached
+        # Picked up without reload since the file changed
         config2 = service.get_config()
-        assert config1 is config2
+        assert config1 is not config2
+        assert len(config2.board.columns) == 2
 
         # After reload
         service.reload()
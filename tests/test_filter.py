@@ -327,3 +327,22 @@ class TestFilterApplication:
         assert len(result) == 2
         task_ids = {t.id for t in result}
         assert task_ids == {"bug1.md", "bug2.md"}
+
+    def test_archived_with_other_filters(
+        self, filter_service: FilterService, sample_tasks: list[Task]
+    ):
+        """archived:true combines with other conditions."""
+        f = filter_service.parse("archived:true type:feature")
+        result = filter_service.apply(sample_tasks, f)
+        assert {t.id for t in result} == {"feature1.md", "archived1.md"}
+
+    def test_filter_changes_apply_on_next_call(
+        self, filter_service: FilterService, sample_tasks: list[Task]
+    ):
+        """Editing a Filter after one apply() is reflected by the next."""
+        f = Filter(tags=["bug"])
+        assert len(filter_service.apply(sample_tasks, f)) == 2
+
+        f.exclude_tags.append("critical")
+        result = filter_service.apply(sample_tasks, f)
+        assert [t.id for t in result] == ["bug1.md"]
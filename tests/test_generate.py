@@ -247,3 +247,30 @@ class TestOutputHelpers:
         captured = capsys.readouterr()
 
         assert "Error message" in captured.out
+
+    def test_prefix_is_plain_without_tty(self, capsys):
+        """Prefixes carry no escape codes when stdout is not a terminal."""
+        from sltasks.cli import output
+
+        output._supports_color.cache_clear()
+        output._prefix.cache_clear()
+        try:
+            output.success("Done")
+            assert capsys.readouterr().out == f"{output.CHECK} Done\n"
+        finally:
+            output._supports_color.cache_clear()
+            output._prefix.cache_clear()
+
+    def test_prefix_is_colored_with_tty(self, monkeypatch):
+        """Prefixes are colored and built once when color is supported."""
+        from sltasks.cli import output
+
+        output._supports_color.cache_clear()
+        output._prefix.cache_clear()
+        monkeypatch.setattr(output, "_supports_color", lambda: True)
+        try:
+            prefix = output._prefix(output.CHECK, output.GREEN)
+            assert prefix == f"{output.GREEN}{output.CHECK}{output.RESET} "
+            assert output._prefix(output.CHECK, output.GREEN) is prefix
+        finally:
+            output._prefix.cache_clear()
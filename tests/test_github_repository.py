@@ -1,6 +1,7 @@
 """Tests for GitHubProjectsRepository."""
 
-from unittest.mock import MagicMock
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -73,6 +74,36 @@ def repo(mock_config_service, mock_client):
     return repo
 
 
+class TestGitHubProjectsRepositoryClient:
+    """Tests for the shared GitHub client."""
+
+    def test_client_created_once(self, mock_config_service):
+        """The client is built from the environment on first use, then reused."""
+        repo = GitHubProjectsRepository(mock_config_service)
+
+        with patch(
+            "sltasks.repositories.github_projects.GitHubClient.from_environment"
+        ) as mock_from_env:
+            assert repo.client is repo.client
+
+        mock_from_env.assert_called_once_with("api.github.com")
+
+    def test_reload_task_reloads_everything(self, repo):
+        """A single edited task drops all cached items."""
+        repo._tasks = {"testuser/testrepo#1": MagicMock()}
+
+        repo.reload_task("testuser/testrepo#1")
+
+        assert repo._tasks == {}
+
+    def test_local_storage_hooks_make_no_api_calls(self, repo, mock_client):
+        """ensure_directory and get_board_metadata are no-ops for GitHub."""
+        repo.ensure_directory()
+
+        assert repo.get_board_metadata() == {}
+        assert not mock_client.method_calls
+
+
 class TestGitHubProjectsRepositoryValidate:
     """Tests for repository validation."""
 
@@ -517,6 +548,19 @@ class TestGitHubProjectsRepositorySave:
         # Verify update mutation was called
         assert mock_client.mutate.call_count >= 1
 
+    def test_update_state_saves_moved_copy(self, repo):
+        """update_state() saves a copy with the new state and timestamp."""
+        task = Task(id="testuser/testrepo#1", title="Task", state="to_do")
+        updated = datetime(2025, 2, 1, tzinfo=UTC)
+
+        with patch.object(repo, "save") as mock_save:
+            moved = repo.update_state(task, "done", updated)
+
+        mock_save.assert_called_once_with(moved)
+        assert moved.state == "done"
+        assert moved.updated == updated
+        assert task.state == "to_do"
+
 
 class TestGitHubProjectsRepositoryDelete:
     """Tests for delete method."""
@@ -0,0 +1,25 @@
+"""Tests for lazily resolved package names."""
+
+import pytest
+
+import sltasks.repositories as repositories
+
+
+class TestLazyModule:
+    """Tests for the PEP 562 hooks built by lazy_module."""
+
+    def test_name_resolved_and_cached(self):
+        """A public name is imported from its submodule and stored on the package."""
+        from sltasks.repositories.protocol import RepositoryProtocol
+
+        assert repositories.RepositoryProtocol is RepositoryProtocol
+        assert vars(repositories)["RepositoryProtocol"] is RepositoryProtocol
+
+    def test_unknown_name_raises(self):
+        """Names outside the mapping raise AttributeError naming the package."""
+        with pytest.raises(AttributeError, match=r"'sltasks\.repositories' has no attribute"):
+            _ = repositories.NotARepository
+
+    def test_dir_lists_lazy_names(self):
+        """dir() includes public names that haven't been imported yet."""
+        assert set(repositories.__all__) <= set(dir(repositories))
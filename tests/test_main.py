@@ -0,0 +1,159 @@
+"""Tests for the CLI entry point."""
+
+import subprocess
+import sys
+
+import pytest
+
+from sltasks import __version__
+from sltasks.__main__ import (
+    _SUBCOMMAND_PARSERS,
+    _is_top_level_help,
+    _print_version,
+    _subcommands_to_build,
+    main,
+    parse_args,
+)
+
+
+class TestVersionFastPath:
+    """Tests for the --version fast path."""
+
+    def test_prints_version(self, capsys):
+        """Bare --version prints the version string."""
+        assert _print_version(["--version"]) is True
+        assert capsys.readouterr().out == f"sltasks {__version__}\n"
+
+    def test_ignores_other_args(self, capsys):
+        """Other argument lists fall through to argparse."""
+        assert _print_version([]) is False
+        assert _print_version(["--version", "push"]) is False
+        assert _print_version(["push", "--dry-run"]) is False
+        assert capsys.readouterr().out == ""
+
+    def test_main_exits_cleanly(self, monkeypatch, capsys):
+        """main() exits with code 0 after printing the version."""
+        monkeypatch.setattr(sys, "argv", ["sltasks", "--version"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
+
+    def test_version_skips_heavy_imports(self):
+        """--version does not import argparse, pathlib, settings or the TUI stack.
+
+        Only modules sltasks itself loads count; site startup may already
+        have imported some of them (pathlib via .pth files, for one).
+        """
+        code = (
+            "import sys\n"
+            "before = set(sys.modules)\n"
+            "sys.argv = ['sltasks', '--version']\n"
+            "from sltasks.__main__ import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = set(sys.modules) - before\n"
+            "heavy = [m for m in ('textual', 'pydantic', 'argparse', 'pathlib') if m in loaded]\n"
+            "print('heavy=' + ','.join(heavy))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.splitlines()[-1] == "heavy="
+
+
+class TestLazySubparsers:
+    """Tests for building only the subcommand parsers argv needs."""
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            ([], []),
+            (["-v", "--log-file", "push"], []),
+            (["--task-root", "sync", "push", "--dry-run"], ["push"]),
+            (["sync", "--force"], ["sync"]),
+            (["--help"], ["push", "sync"]),
+            (["push", "-h"], ["push", "sync"]),
+            (["bogus"], ["push", "sync"]),
+        ],
+    )
+    def test_subcommands_to_build(self, argv, expected):
+        """Only named subcommands are built; help and unknown words build all."""
+        assert _subcommands_to_build(argv) == expected
+
+    def test_parse_args_without_subcommand(self, monkeypatch):
+        """A TUI launch parses with no command and no subparsers built."""
+        monkeypatch.setattr(sys, "argv", ["sltasks", "--task-root", "push"])
+        args = parse_args()
+        assert args.command is None
+        assert str(args.task_root) == "push"
+
+    def test_parse_args_with_subcommand(self, monkeypatch):
+        """A subcommand still parses its own arguments."""
+        monkeypatch.setattr(sys, "argv", ["sltasks", "push", "a.md", "--dry-run", "-y"])
+        args = parse_args()
+        assert args.command == "push"
+        assert args.files == ["a.md"]
+        assert args.dry_run is True
+        assert args.yes is True
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["-h"], True),
+            (["-v", "--help"], True),
+            (["--task-root", "push", "-h"], True),
+            (["push", "-h"], False),
+            (["push"], False),
+            ([], False),
+        ],
+    )
+    def test_is_top_level_help(self, argv, expected):
+        """Help before any subcommand word is the top-level help."""
+        assert _is_top_level_help(argv) is expected
+
+    def test_top_level_help_lists_commands_without_building_them(self, monkeypatch, capsys):
+        """--help lists every subcommand but doesn't add their arguments."""
+        built = []
+        monkeypatch.setattr(sys, "argv", ["sltasks", "--help"])
+        monkeypatch.setitem(_SUBCOMMAND_PARSERS, "push", built.append)
+        monkeypatch.setitem(_SUBCOMMAND_PARSERS, "sync", built.append)
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args()
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        assert "Push local tasks to GitHub as new issues" in out
+        assert "Sync issues from GitHub to local files" in out
+        assert built == []
+
+    def test_unknown_subcommand_still_rejected(self, monkeypatch, capsys):
+        """An unknown word keeps argparse's invalid choice error."""
+        monkeypatch.setattr(sys, "argv", ["sltasks", "bogus"])
+        with pytest.raises(SystemExit):
+            parse_args()
+        assert "invalid choice" in capsys.readouterr().err
+
+
+class TestSubcommandDispatch:
+    """Tests for dispatching subcommands to their runners."""
+
+    def test_sync_dispatches_to_runner(self, monkeypatch, tmp_path):
+        """main() imports the runner and passes the parsed arguments by name."""
+        import sltasks.cli.sync
+
+        calls = []
+
+        def fake_run_sync(**kwargs):
+            calls.append(kwargs)
+            return 3
+
+        monkeypatch.setattr(sltasks.cli.sync, "run_sync", fake_run_sync)
+        monkeypatch.setattr(
+            sys, "argv", ["sltasks", "--task-root", str(tmp_path), "sync", "--dry-run"]
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 3
+        assert calls == [{"project_root": tmp_path, "dry_run": True, "force": False}]
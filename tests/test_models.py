@@ -2,6 +2,8 @@
 
 from datetime import UTC, datetime
 
+import pytest
+
 from sltasks.models import Board, BoardConfig, BoardOrder, ColumnConfig, Task
 from sltasks.models.task import (
     STATE_ARCHIVED,
@@ -70,6 +72,23 @@ class TestTaskDisplayTitle:
         task = Task(id="fix-login-timeout-bug.md", title=None)
         assert task.display_title == "Fix Login Timeout Bug"
 
+    def test_display_title_recomputed_after_model_copy_update(self):
+        """A cached display_title doesn't leak into updated copies."""
+        task = Task(id="my-task.md")
+        assert task.display_title == "My Task"
+
+        renamed = task.model_copy(update={"title": "Renamed"})
+        assert renamed.display_title == "Renamed"
+        assert task.display_title == "My Task"
+
+    def test_display_title_not_serialized(self):
+        """The cached display_title is not part of the dumped fields."""
+        task = Task(id="my-task.md")
+        _ = task.display_title
+
+        assert "display_title" not in task.model_dump()
+        assert task == Task(id="my-task.md")
+
 
 class TestParseDatetime:
     """Tests for _parse_datetime helper."""
@@ -139,6 +158,18 @@ class TestBoardFromTasks:
         assert board.get_column(STATE_DONE) == []
         assert board.get_column(STATE_ARCHIVED) == []
 
+    def test_from_tasks_without_config_reuses_default(self):
+        """Boards built without a config share one default BoardConfig."""
+        first = Board.from_tasks([])
+        second = Board.from_tasks([])
+
+        assert [col_id for col_id, _, _ in first.get_visible_columns()] == [
+            STATE_TODO,
+            STATE_IN_PROGRESS,
+            STATE_DONE,
+        ]
+        assert first._config is second._config
+
     def test_from_tasks_multiple_same_state(self):
         """from_tasks handles multiple tasks in same state."""
         tasks = [
@@ -288,6 +319,26 @@ class TestBoardOrderDynamic:
         assert "archived" in order.columns  # Always added
         assert "todo" not in order.columns  # Not in config
 
+    def test_task_ids_share_string_with_tasks(self):
+        """Board order entries are the same string object as the Task id."""
+        task_id = "".join(["shared", "-id.md"])  # Built at runtime, not a literal
+        task = Task(id=task_id)
+        order = BoardOrder.from_dict({"columns": {"todo": ["".join(["shared", "-id.md"])]}})
+        added = BoardOrder()
+        added.add_task("".join(["shared", "-id.md"]), "todo")
+
+        assert order.columns["todo"][0] is task.id
+        assert added.columns["todo"][0] is task.id
+
+    def test_get_position_uses_task_column(self):
+        """get_position finds tasks in their column and -1 elsewhere."""
+        order = BoardOrder(columns={"todo": ["a.md", "b.md"], "done": ["c.md"]})
+
+        assert order.get_position("b.md", "todo") == 1
+        assert order.get_position("c.md", "done") == 0
+        assert order.get_position("c.md", "todo") == -1
+        assert order.get_position("missing.md", "todo") == -1
+
     def test_ensure_column_creates_missing(self):
         """ensure_column creates column if missing."""
         order = BoardOrder.default()
@@ -306,6 +357,79 @@ class TestBoardOrderDynamic:
 
         assert order.columns["todo"] == ["task.md"]
 
+    def test_move_task_updates_column_index(self):
+        """Moving a task updates both the column lists and column_of."""
+        order = BoardOrder.default()
+        order.add_task("task.md", "todo")
+
+        order.move_task("task.md", "todo", "done")
+
+        assert order.columns["todo"] == []
+        assert order.columns["done"] == ["task.md"]
+        assert order.column_of("task.md") == "done"
+
+    def test_remove_task_clears_index(self):
+        """remove_task drops the task from its column and the index."""
+        order = BoardOrder(columns={"todo": ["a.md", "b.md"], "done": ["c.md"]})
+
+        order.remove_task("a.md")
+        order.remove_task("missing.md")
+
+        assert order.columns == {"todo": ["b.md"], "done": ["c.md"]}
+        assert order.column_of("a.md") is None
+
+    def test_retain_tasks_drops_unknown_ids(self):
+        """retain_tasks keeps only the given IDs, preserving order."""
+        order = BoardOrder(columns={"todo": ["a.md", "x.md", "b.md"], "done": ["c.md"]})
+
+        assert order.retain_tasks({"a.md", "b.md", "c.md"}) is True
+        assert order.columns == {"todo": ["a.md", "b.md"], "done": ["c.md"]}
+        assert order.column_of("x.md") is None
+        assert order.retain_tasks({"a.md", "b.md", "c.md"}) is False
+
+    def test_rename_task_keeps_position(self):
+        """rename_task replaces the ID in place."""
+        order = BoardOrder(columns={"todo": ["a.md", "b.md", "c.md"]})
+
+        order.rename_task("b.md", "renamed.md")
+
+        assert order.columns["todo"] == ["a.md", "renamed.md", "c.md"]
+        assert order.column_of("renamed.md") == "todo"
+        assert order.column_of("b.md") is None
+
+    def test_reindex_drops_duplicate_entries(self):
+        """A task listed in several columns keeps only its first occurrence."""
+        order = BoardOrder(columns={"todo": ["a.md", "a.md"], "done": ["a.md", "b.md"]})
+
+        assert order.columns == {"todo": ["a.md"], "done": ["b.md"]}
+        assert order.column_of("a.md") == "todo"
+
+    def test_from_dict_round_trip(self):
+        """from_dict/to_dict round-trip tasks.yaml data and build the index."""
+        data = {"version": 1, "columns": {"todo": ["a.md"], "done": None}}
+
+        order = BoardOrder.from_dict(data)
+
+        assert order.columns == {"todo": ["a.md"], "done": []}
+        assert order.column_of("a.md") == "todo"
+        assert order.to_dict() == {"version": 1, "columns": {"todo": ["a.md"], "done": []}}
+
+    def test_from_dict_empty(self):
+        """from_dict tolerates an empty tasks.yaml."""
+        order = BoardOrder.from_dict({})
+
+        assert order.version == 1
+        assert order.columns == {}
+
+    def test_reindex_after_direct_edit(self):
+        """reindex() picks up columns edited directly."""
+        order = BoardOrder.default()
+        order.columns["in_progress"] = ["task.md"]
+
+        order.reindex()
+
+        assert order.column_of("task.md") == "in_progress"
+
 
 class TestTaskOptionalPriority:
     """Tests for Task model with optional (None) priority."""
@@ -382,3 +506,22 @@ class TestTaskImmutability:
 
         # Updated has new tags
         assert updated.tags == ["new-tag"]
+
+
+class TestLazyModelExports:
+    """Tests for lazy package-level re-exports."""
+
+    def test_resolves_to_submodule_object(self):
+        """Package attributes are the same objects as the submodule definitions."""
+        import sltasks.models
+        from sltasks.models import sync
+
+        assert sltasks.models.SyncStatus is sync.SyncStatus
+        assert "SyncStatus" in dir(sltasks.models)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Unknown names raise AttributeError rather than ImportError."""
+        import sltasks.models
+
+        with pytest.raises(AttributeError):
+            _ = sltasks.models.DoesNotExist
@@ -1,16 +1,22 @@
 """Integration tests for FilesystemRepository."""
 
+import os
+from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 
+import frontmatter
 import pytest
+from pydantic import ValidationError
 
-from sltasks.models import BoardOrder, Task
+from sltasks.models import BoardOrder, FileProviderData, Task
 from sltasks.models.task import (
     STATE_DONE,
     STATE_IN_PROGRESS,
     STATE_TODO,
 )
 from sltasks.repositories import FilesystemRepository
+from sltasks.repositories.filesystem import _split_front_matter
 
 
 @pytest.fixture
@@ -87,6 +93,20 @@ class TestFilesystemRepository:
         task = repo.get_by_id("nonexistent.md")
         assert task is None
 
+    def test_loaded_tasks_share_file_provider_data(
+        self, task_dir: Path, repo: FilesystemRepository
+    ):
+        """File tasks carry one shared, immutable FileProviderData."""
+        (task_dir / "a.md").write_text("---\nstate: todo\n---\n")
+        (task_dir / "b.md").write_text("---\nstate: done\n---\n")
+
+        first, second = repo.get_all()
+
+        assert isinstance(first.provider_data, FileProviderData)
+        assert first.provider_data is second.provider_data
+        with pytest.raises(ValidationError):
+            first.provider_data.provider = "file"
+
     def test_save_creates_new_task(self, repo: FilesystemRepository, task_dir: Path):
         """save creates a new task file."""
         task = Task(
@@ -116,6 +136,25 @@ class TestFilesystemRepository:
         assert "priority: high" in content
         assert "Task description here." in content
 
+    def test_save_matches_default_frontmatter_output(
+        self, repo: FilesystemRepository, task_dir: Path
+    ):
+        """The libyaml dumper writes the same file as frontmatter's default dumper."""
+        task = Task(
+            id="unicode.md",
+            title="Café: «quoted» task",
+            state=STATE_TODO,
+            tags=["a", "b c"],
+            created=datetime(2025, 1, 15, 10, 30, tzinfo=UTC),
+            body="Body text.",
+        )
+        repo.save(task)
+
+        post = frontmatter.Post(task.body)
+        post.metadata = task.to_frontmatter()
+        expected = frontmatter.dumps(post, sort_keys=False)
+        assert (task_dir / "unicode.md").read_text() == expected
+
     def test_save_updates_existing_task(self, repo: FilesystemRepository, task_dir: Path):  # noqa: ARG002
         """save updates an existing task file."""
         # Create initial task
@@ -152,6 +191,17 @@ class TestFilesystemRepository:
         """delete doesn't raise error for nonexistent file."""
         repo.delete("nonexistent.md")  # Should not raise
 
+    def test_get_all_only_reads_visible_markdown_files(
+        self, task_dir: Path, repo: FilesystemRepository
+    ):
+        """get_all skips hidden files, directories, and non-.md files."""
+        (task_dir / "task.md").write_text("---\nstate: todo\n---\n")
+        (task_dir / ".hidden.md").write_text("---\nstate: todo\n---\n")
+        (task_dir / "notes.txt").write_text("---\nstate: todo\n---\n")
+        (task_dir / "folder.md").mkdir()
+
+        assert [t.id for t in repo.get_all()] == ["task.md"]
+
 
 class TestBoardOrder:
     """Tests for board order management."""
@@ -195,6 +245,42 @@ class TestBoardOrder:
 
         assert reloaded.columns["todo"] == ["b.md", "a.md"]
 
+    def test_unchanged_order_is_not_rewritten(self, repo: FilesystemRepository, task_dir: Path):
+        """Saving a task body without changing the order skips the tasks.yaml write."""
+        task = Task(id="task.md", title="Task", state=STATE_TODO)
+        repo.save(task)
+        yaml_path = task_dir / "tasks.yaml"
+
+        with patch.object(Path, "write_bytes", wraps=yaml_path.write_bytes) as write:
+            repo.save(task.model_copy(update={"body": "Edited"}))
+
+        write.assert_not_called()
+
+    def test_board_order_replaced_atomically(self, repo: FilesystemRepository, task_dir: Path):
+        """A failed write leaves the previous tasks.yaml intact and no temp file."""
+        repo.save(Task(id="first.md", state=STATE_TODO))
+        yaml_path = task_dir / "tasks.yaml"
+        before = yaml_path.read_text()
+
+        with (
+            patch.object(Path, "replace", side_effect=OSError("disk")),
+            pytest.raises(OSError),
+        ):
+            repo.save(Task(id="second.md", state=STATE_TODO))
+
+        assert yaml_path.read_text() == before
+        assert sorted(p.name for p in task_dir.iterdir()) == ["first.md", "second.md", "tasks.yaml"]
+
+    def test_externally_edited_order_is_rewritten(self, repo: FilesystemRepository, task_dir: Path):
+        """An identical order is written again if tasks.yaml changed on disk."""
+        repo.save(Task(id="task.md", title="Task", state=STATE_TODO))
+        yaml_path = task_dir / "tasks.yaml"
+        yaml_path.unlink()
+
+        repo.save_board_order(repo.get_board_order())
+
+        assert "task.md" in yaml_path.read_text()
+
 
 class TestReconciliation:
     """Tests for reconciliation logic."""
@@ -265,6 +351,18 @@ class TestReconciliation:
         task_ids = [t.id for t in todo_tasks]
         assert task_ids == ["b.md", "a.md", "c.md"]
 
+    def test_unknown_state_tasks_sorted_last(self, repo: FilesystemRepository):
+        """Tasks in columns outside the config come after every configured column."""
+        repo.save(Task(id="z-custom.md", state="custom"))
+        repo.save(Task(id="archived.md", state="archived"))
+        repo.save(Task(id="a-custom.md", state="custom"))
+        repo.save(Task(id="done.md", state=STATE_DONE))
+        repo.save(Task(id="todo.md", state=STATE_TODO))
+
+        task_ids = [t.id for t in repo.get_all()]
+
+        assert task_ids == ["todo.md", "done.md", "archived.md", "a-custom.md", "z-custom.md"]
+
 
 class TestReload:
     """Tests for reload functionality."""
@@ -294,6 +392,89 @@ class TestReload:
         assert task is not None
         assert task.state == STATE_TODO  # Normalized from 'new'
 
+    def test_reload_keeps_unchanged_board_order(self, repo: FilesystemRepository):
+        """reload reuses the board order when tasks.yaml is unchanged."""
+        repo.save(Task(id="task.md", state=STATE_TODO))
+        order = repo.get_board_order()
+
+        repo.reload()
+
+        assert repo.get_board_order() is order
+
+    def test_reload_rereads_edited_board_order(self, task_dir: Path, repo: FilesystemRepository):
+        """reload re-reads tasks.yaml after it is edited on disk."""
+        repo.save(Task(id="a.md", state=STATE_TODO))
+        repo.save(Task(id="b.md", state=STATE_TODO))
+        assert repo.get_board_order().columns["todo"] == ["a.md", "b.md"]
+
+        (task_dir / "tasks.yaml").write_text("version: 1\ncolumns:\n  todo:\n  - b.md\n  - a.md\n")
+        repo.reload()
+
+        assert [t.id for t in repo.get_all()] == ["b.md", "a.md"]
+
+    def test_reload_skips_rescan_when_directory_unchanged(
+        self, task_dir: Path, repo: FilesystemRepository
+    ):
+        """An unchanged, settled directory keeps the loaded tasks across reload."""
+        (task_dir / "task.md").write_text("---\nstate: todo\n---\n")
+        _age_file(task_dir / "task.md")
+        tasks = repo.get_all()
+
+        repo.reload()
+        with patch.object(repo, "_load_tasks") as mock_load:
+            assert repo.get_all() == tasks
+
+        mock_load.assert_not_called()
+
+    def test_reload_rescans_after_edit(self, task_dir: Path, repo: FilesystemRepository):
+        """Editing a file changes the fingerprint, so reload rescans."""
+        path = task_dir / "task.md"
+        path.write_text("---\ntitle: Before\nstate: todo\n---\n")
+        _age_file(path, 120)
+        repo.get_all()
+
+        path.write_text("---\ntitle: After\nstate: todo\n---\n")
+        _age_file(path, 60)
+        repo.reload()
+
+        assert [t.title for t in repo.get_all()] == ["After"]
+
+    def test_reload_task_rereads_only_that_file(self, task_dir: Path, repo: FilesystemRepository):
+        """reload_task picks up an edit without rescanning the directory."""
+        (task_dir / "a.md").write_text("---\ntitle: Before\nstate: todo\n---\n")
+        (task_dir / "b.md").write_text("---\ntitle: Other\nstate: todo\n---\n")
+        repo.get_all()
+
+        (task_dir / "a.md").write_text("---\ntitle: After\nstate: done\n---\n")
+        repo.reload_task("a.md")
+        with patch.object(repo, "_load_tasks") as mock_load:
+            tasks = {t.id: t for t in repo.get_all()}
+
+        mock_load.assert_not_called()
+        assert tasks["a.md"].title == "After"
+        assert tasks["a.md"].state == STATE_DONE
+        assert tasks["b.md"].title == "Other"
+
+    def test_reload_task_drops_deleted_file(self, task_dir: Path, repo: FilesystemRepository):
+        """reload_task forgets a task whose file is gone."""
+        (task_dir / "a.md").write_text("---\nstate: todo\n---\n")
+        (task_dir / "b.md").write_text("---\nstate: todo\n---\n")
+        repo.get_all()
+
+        (task_dir / "a.md").unlink()
+        repo.reload_task("a.md")
+
+        assert [t.id for t in repo.get_all()] == ["b.md"]
+
+    def test_reload_task_before_scan_reloads(self, task_dir: Path, repo: FilesystemRepository):
+        """reload_task falls back to a full reload if nothing was scanned yet."""
+        (task_dir / "a.md").write_text("---\nstate: todo\n---\n")
+
+        with patch.object(repo, "reload") as mock_reload:
+            repo.reload_task("a.md")
+
+        mock_reload.assert_called_once_with()
+
 
 class TestOptionalPriority:
     """Tests for optional (None) priority support."""
@@ -359,3 +540,233 @@ class TestOptionalPriority:
         loaded = repo.get_by_id("with-assignees.md")
         assert loaded is not None
         assert loaded.assignees == ["alice", "bob"]
+
+
+def _age_file(path: Path, seconds: int = 60) -> None:
+    """Backdate a file's mtime so it falls outside the racy window."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestParseCache:
+    """Tests for reusing parsed task files across reloads."""
+
+    def test_unchanged_file_not_reparsed(self, task_dir: Path, repo: FilesystemRepository):
+        """Reloading reuses parsed tasks whose files haven't changed."""
+        path = task_dir / "task.md"
+        path.write_text("---\ntitle: Cached\nstate: todo\n---\n")
+        _age_file(path)
+        repo.get_all()
+
+        repo.reload()
+        with patch.object(repo, "_parse_task_file") as mock_parse:
+            tasks = repo.get_all()
+
+        mock_parse.assert_not_called()
+        assert [t.title for t in tasks] == ["Cached"]
+
+    def test_edited_file_reparsed(self, task_dir: Path, repo: FilesystemRepository):
+        """Editing a file on disk invalidates its cached task."""
+        path = task_dir / "task.md"
+        path.write_text("---\ntitle: Before\nstate: todo\n---\n")
+        _age_file(path, 120)
+        repo.get_all()
+
+        path.write_text("---\ntitle: After!\nstate: done\n---\n")
+        _age_file(path)
+        repo.reload()
+        task = repo.get_by_id("task.md")
+
+        assert task is not None
+        assert task.title == "After!"
+        assert task.state == STATE_DONE
+
+    def test_recent_file_always_reparsed(self, task_dir: Path, repo: FilesystemRepository):
+        """Files written within the racy window are not cached."""
+        (task_dir / "task.md").write_text("---\nstate: todo\n---\n")
+        repo.get_all()
+
+        assert repo._parse_cache == {}
+
+    def test_deleted_file_dropped(self, task_dir: Path, repo: FilesystemRepository):
+        """Deleted files disappear from the board and the cache."""
+        path = task_dir / "task.md"
+        path.write_text("---\nstate: todo\n---\n")
+        _age_file(path)
+        repo.get_all()
+
+        path.unlink()
+        repo.reload()
+
+        assert repo.get_all() == []
+        assert repo._parse_cache == {}
+
+    def test_get_all_reuses_scan_until_reload(self, task_dir: Path, repo: FilesystemRepository):
+        """get_all doesn't rescan the directory until reload."""
+        (task_dir / "a.md").write_text("---\nstate: todo\n---\n")
+        repo.get_all()
+
+        with patch.object(repo, "_iter_task_files") as mock_iter:
+            assert [t.id for t in repo.get_all()] == ["a.md"]
+            mock_iter.assert_not_called()
+
+        (task_dir / "b.md").write_text("---\nstate: todo\n---\n")
+        repo.reload()
+        assert [t.id for t in repo.get_all()] == ["a.md", "b.md"]
+
+    def test_get_all_reuses_sorted_snapshot(self, repo: FilesystemRepository):
+        """Repeated get_all calls skip reconcile and sorting until order changes."""
+        repo.save(Task(id="a.md", state=STATE_TODO))
+        repo.save(Task(id="b.md", state=STATE_TODO))
+        first = repo.get_all()
+
+        with patch.object(repo, "_reconcile") as mock_reconcile:
+            second = repo.get_all()
+            mock_reconcile.assert_not_called()
+        assert [t.id for t in second] == [t.id for t in first]
+        assert second is not first  # Callers get their own list
+
+        repo.reorder_task("b.md", -1)
+        assert [t.id for t in repo.get_all()] == ["b.md", "a.md"]
+
+    def test_writes_trigger_rescan(self, repo: FilesystemRepository):
+        """Saving or deleting through the repository is visible to get_all."""
+        repo.save(Task(id="a.md", state=STATE_TODO))
+        assert [t.id for t in repo.get_all()] == ["a.md"]
+
+        repo.save(Task(id="a.md", title="Renamed", state=STATE_DONE))
+        repo.save(Task(id="b.md", state=STATE_TODO))
+        tasks = {t.id: t for t in repo.get_all()}
+        assert tasks["a.md"].state == STATE_DONE
+        assert "b.md" in tasks
+
+        repo.delete("a.md")
+        assert [t.id for t in repo.get_all()] == ["b.md"]
+
+    def test_ensure_directory_checked_once_per_reload(self, tmp_path: Path):
+        """ensure_directory only hits the filesystem again after reload."""
+        repo = FilesystemRepository(tmp_path / ".tasks")
+        repo.ensure_directory()
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            repo.ensure_directory()
+            mock_mkdir.assert_not_called()
+
+            repo.reload()
+            repo.ensure_directory()
+            mock_mkdir.assert_called_once()
+
+
+class TestUpdateState:
+    """Tests for moving a task by patching its front matter lines."""
+
+    def test_patches_only_state_and_updated(self, task_dir: Path, repo: FilesystemRepository):
+        """Other front matter formatting, including comments, is kept as written."""
+        path = task_dir / "task.md"
+        path.write_text(
+            "---\n# keep me\nstate: todo\ntitle: Hand written\n"
+            "updated: 2025-01-01T00:00:00+00:00\n---\n\nBody\n"
+        )
+        task = repo.get_by_id("task.md")
+        assert task is not None
+
+        moved = repo.update_state(task, STATE_DONE, datetime(2025, 2, 1, tzinfo=UTC))
+
+        assert path.read_text() == (
+            "---\n# keep me\nstate: done\ntitle: Hand written\n"
+            "updated: '2025-02-01T00:00:00+00:00'\n---\n\nBody\n"
+        )
+        assert moved.state == STATE_DONE
+        assert repo.get_by_id("task.md") == moved
+        assert "task.md" in repo.get_board_order().columns["done"]
+
+    def test_matches_full_save_output(self, task_dir: Path, repo: FilesystemRepository):
+        """Patching a file sltasks wrote gives the same bytes as saving it."""
+        task = Task(id="task.md", title="Task", state=STATE_TODO, updated=datetime.now(UTC))
+        repo.save(task)
+        updated = datetime(2025, 3, 1, 12, 30, tzinfo=UTC)
+
+        moved = repo.update_state(task, STATE_IN_PROGRESS, updated)
+        patched = (task_dir / "task.md").read_text()
+        repo.save(moved)
+
+        assert patched == (task_dir / "task.md").read_text()
+
+    def test_keeps_crlf_line_endings(self, task_dir: Path, repo: FilesystemRepository):
+        """Files written with CRLF line endings keep them when patched."""
+        path = task_dir / "task.md"
+        path.write_bytes(
+            b"---\r\nstate: todo\r\ntitle: Windows\r\n"
+            b"updated: 2025-01-01T00:00:00+00:00\r\n---\r\n\r\nBody\r\n"
+        )
+        task = repo.get_by_id("task.md")
+        assert task is not None
+
+        repo.update_state(task, STATE_DONE, datetime(2025, 2, 1, tzinfo=UTC))
+
+        assert path.read_bytes() == (
+            b"---\r\nstate: done\r\ntitle: Windows\r\n"
+            b"updated: '2025-02-01T00:00:00+00:00'\r\n---\r\n\r\nBody\r\n"
+        )
+
+    def test_falls_back_to_save_without_updated_line(
+        self, task_dir: Path, repo: FilesystemRepository
+    ):
+        """Files without an updated entry are rewritten in full."""
+        path = task_dir / "task.md"
+        path.write_text("---\nstate: todo\n---\nBody")
+        task = repo.get_by_id("task.md")
+        assert task is not None
+
+        repo.update_state(task, STATE_DONE, datetime(2025, 2, 1, tzinfo=UTC))
+
+        reloaded = repo.get_by_id("task.md")
+        assert reloaded is not None
+        assert reloaded.state == STATE_DONE
+        assert reloaded.updated == datetime(2025, 2, 1, tzinfo=UTC)
+        assert reloaded.body == "Body"
+
+
+class TestLargeDirectory:
+    """Tests for reading task directories with many files."""
+
+    def test_large_directory_loaded_in_board_order(
+        self, task_dir: Path, repo: FilesystemRepository
+    ):
+        """Every file is loaded, in board order."""
+        count = 60
+        for i in range(count):
+            (task_dir / f"task-{i:03}.md").write_text(f"---\ntitle: Task {i}\nstate: todo\n---\n")
+
+        tasks = repo.get_all()
+
+        assert len(tasks) == count
+        assert {t.title for t in tasks} == {f"Task {i}" for i in range(count)}
+        assert [t.id for t in tasks] == repo.get_board_order().columns["todo"]
+
+
+class TestSplitFrontMatter:
+    """Tests for the YAML front matter splitter."""
+
+    def test_matches_python_frontmatter(self):
+        """Splitting agrees with frontmatter.loads for YAML task files."""
+        samples = [
+            "---\ntitle: Task\nstate: todo\n---\nBody text\n",
+            "---\ntitle: Task\ntags: [a, b]\n---\n\n# Heading\n\n- item\n---\nmore\n",
+            "\n\n---   \nstate: done\n-----\nTrailing fence\n",
+            "---\n---\nEmpty header",
+            "---\n- just\n- a list\n---\nNon-dict header",
+            "No front matter at all",
+            "---\ntitle: Unclosed",
+            "",
+        ]
+        for text in samples:
+            post = frontmatter.loads(text)
+            assert _split_front_matter(text) == (post.metadata, post.content), text
+
+    def test_invalid_yaml_skips_task(self, task_dir: Path, repo: FilesystemRepository):
+        """Files with malformed front matter are skipped, not fatal."""
+        (task_dir / "bad.md").write_text("---\ntitle: [unclosed\n---\nBody")
+        (task_dir / "good.md").write_text("---\ntitle: Good\n---\nBody")
+
+        assert [t.id for t in repo.get_all()] == ["good.md"]
@@ -54,6 +54,17 @@ class TestColumnConfig:
         with pytest.raises(ValidationError):
             ColumnConfig(id="", title="Empty")
 
+    def test_trailing_newline_rejected(self):
+        """A trailing newline doesn't slip past the identifier check."""
+        with pytest.raises(ValidationError) as exc_info:
+            ColumnConfig(id="todo\n", title="To Do")
+        assert "alphanumeric" in str(exc_info.value).lower()
+
+    def test_non_ascii_lowercase_letters_accepted(self):
+        """Non-ASCII lowercase letters remain valid, as str.isalnum allows them."""
+        col = ColumnConfig(id="café", title="Café")
+        assert col.id == "café"
+
     def test_empty_title_rejected(self):
         """Empty title is rejected."""
         with pytest.raises(ValidationError):
@@ -282,6 +293,101 @@ class TestBoardConfig:
         )
         assert config.column_ids == ["backlog", "active", "done"]
 
+    def test_next_column_id_cycles_and_wraps(self):
+        """next_column_id follows column order and wraps to the first column."""
+        config = BoardConfig.default()
+        assert config.next_column_id("todo") == "in_progress"
+        assert config.next_column_id("in_progress") == "done"
+        assert config.next_column_id("done") == "todo"
+
+    def test_next_column_id_unknown_goes_to_first(self):
+        """Unknown and archived states cycle to the first column."""
+        config = BoardConfig.default()
+        assert config.next_column_id("unknown") == "todo"
+        assert config.next_column_id("archived") == "todo"
+
+    def test_column_cycle_is_cached(self):
+        """The cycle table is built once per config instance."""
+        config = BoardConfig.default()
+        assert config.column_cycle is config.column_cycle
+        assert "column_cycle" not in config.model_dump()
+
+    def test_column_neighbors_stop_at_the_ends(self):
+        """column_neighbors gives (previous, next) without wrapping."""
+        config = BoardConfig.default()
+        assert config.column_neighbors == {
+            "todo": (None, "in_progress"),
+            "in_progress": ("todo", "done"),
+            "done": ("in_progress", None),
+        }
+        assert config.column_neighbors is config.column_neighbors
+
+    def test_status_lookups_use_ids_and_aliases(self):
+        """Status lookups agree for IDs, aliases, archived and unknown values."""
+        config = BoardConfig.default()
+
+        assert config.resolve_status("completed") == "done"
+        assert config.resolve_status("todo") == "todo"
+        assert config.resolve_status("mystery") == "mystery"
+        assert config.get_column_for_status("new") == "todo"
+        assert config.get_column_for_status("archived") == "archived"
+        assert config.get_column_for_status("mystery") is None
+        assert config.is_valid_status("finished")
+        assert not config.is_valid_status("mystery")
+
+    def test_priority_lookups_use_ids_and_aliases(self):
+        """Priority lookups agree for IDs, aliases and unknown values."""
+        config = BoardConfig.default()
+
+        assert config.get_priority("high") is config.priorities[2]
+        assert config.get_priority("important") is None
+        assert config.get_priority_rank("low") == 0
+        assert config.get_priority_rank("urgent") == 3
+        assert config.get_priority_rank("mystery") == -1
+
+    def test_column_ids_returns_a_fresh_list(self):
+        """column_ids can be modified by callers without affecting the config."""
+        config = BoardConfig.default()
+        ids = config.column_ids
+        ids.append("extra")
+
+        assert config.column_ids == ["todo", "in_progress", "done"]
+        assert config.get_title("extra") == "Extra"
+
+    def test_model_copy_rebuilds_cached_lookups(self):
+        """A copy with new columns and priorities doesn't reuse the original's tables."""
+        config = BoardConfig.default()
+        # Fill the caches on the original first
+        assert config.column_ids == ["todo", "in_progress", "done"]
+        assert config.resolve_status("completed") == "done"
+        assert config.get_priority_rank("critical") == 3
+
+        copied = config.model_copy(
+            update={
+                "columns": [
+                    ColumnConfig(id="backlog", title="Backlog", status_alias=["later"]),
+                    ColumnConfig(id="shipped", title="Shipped"),
+                ],
+                "priorities": config.priorities[2:],
+            }
+        )
+
+        assert copied.column_ids == ["backlog", "shipped"]
+        assert copied.get_title("backlog") == "Backlog"
+        assert copied.get_title("todo") == "Todo"
+        assert copied.resolve_status("later") == "backlog"
+        assert copied.resolve_status("completed") == "completed"
+        assert copied.get_priority_rank("high") == 0
+        assert copied.get_priority_rank("low") == -1
+        # The original keeps its own tables
+        assert config.column_ids == ["todo", "in_progress", "done"]
+
+    def test_board_config_is_frozen(self):
+        """BoardConfig can't be mutated, so cached lookups stay valid."""
+        config = BoardConfig.default()
+        with pytest.raises(ValidationError):
+            config.columns = []
+
 
 class TestSltasksConfig:
     """Tests for SltasksConfig model."""
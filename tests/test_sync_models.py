@@ -127,6 +127,7 @@ class TestChangeSet:
         assert changes.to_pull == []
         assert changes.to_push == []
         assert changes.conflicts == []
+        assert changes.synced == []
 
     def test_changeset_with_values(self):
         """ChangeSet with values."""
@@ -0,0 +1,21 @@
+"""Tests for the task card widget's text helpers."""
+
+from sltasks.ui.widgets.task_card import _body_preview
+
+
+class TestBodyPreview:
+    """Tests for the body preview line."""
+
+    def test_skips_long_heading_block(self):
+        """Text after more than 512 characters of headings is still previewed."""
+        headings = "".join(f"# Section heading number {i}\n\n" for i in range(40))
+        assert len(headings) > 512
+
+        assert _body_preview(headings + "  First real line\nSecond line\n") == "First real line"
+
+    def test_truncates_long_line(self):
+        """Long preview lines are cut to 50 characters with an ellipsis."""
+        preview = _body_preview("x" * 80)
+
+        assert len(preview) == 50
+        assert preview.endswith("…")
@@ -85,6 +85,18 @@ class TestTaskServiceCreate:
         assert task2.id == "same-title-1.md"
         assert task3.id == "same-title-2.md"
 
+    def test_create_task_skips_unparseable_file_names(
+        self, task_service: TaskService, task_dir: Path
+    ):
+        """An existing file that can't be parsed still counts as taken."""
+        broken = task_dir / "fix-bug.md"
+        broken.write_text("---\ntitle: [unclosed\n---\n")
+
+        task = task_service.create_task("Fix Bug")
+
+        assert task.id == "fix-bug-1.md"
+        assert broken.read_text() == "---\ntitle: [unclosed\n---\n"
+
     def test_create_task_without_priority_defaults_to_none(self, task_service: TaskService):
         """create_task without priority results in None priority."""
         task = task_service.create_task("No Priority Task")